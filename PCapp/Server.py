@@ -1,4 +1,4 @@
-import os, tempfile, subprocess, json, asyncio, shutil, re, time, math
+import os, tempfile, subprocess, json, asyncio, shutil, re, time, math, heapq
 import datetime as dt
 from typing import Optional
 import threading
@@ -10,7 +10,7 @@ from typing import Optional
 import threading
 
 import requests
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, Response
 from faster_whisper import WhisperModel
 from typing import Optional
 from PIapp.nlu import get_intent  # lightweight NLU, avoids pvporcupine dependency
@@ -345,6 +345,43 @@ def plan_alarm(arrival_hhmm: str, destination: str, prep_minutes: Optional[int])
 def _have_ffmpeg() -> bool:
     return shutil.which("ffmpeg") is not None
 
+# In-process decode for uploads (soundfile + soxr ship with requirements_PC); ffmpeg is the fallback
+try:
+    import numpy as np
+    import soundfile as _sf
+except Exception:
+    _sf = None
+try:
+    import soxr
+except Exception:
+    soxr = None
+
+def _upload_formats() -> list:
+    """Upload encodings /transcribe and /converse accept, advertised to the Pi via /health."""
+    fmts = ["wav"]
+    sf_formats = _sf.available_formats() if _sf is not None else {}
+    sf_ogg = _sf.available_subtypes("OGG") if _sf is not None else {}
+    if "FLAC" in sf_formats or _have_ffmpeg():
+        fmts.append("flac")
+    if ("OPUS" in sf_ogg and soxr is not None) or _have_ffmpeg():
+        fmts.append("opus")
+    return fmts
+
+def _load_audio(in_path: str):
+    """Decode an upload to 16 kHz mono float32 without spawning ffmpeg; None if not possible."""
+    if _sf is None:
+        return None
+    try:
+        data, sr = _sf.read(in_path, dtype="float32", always_2d=True)
+    except Exception:
+        return None
+    mono = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+    if sr != 16000:
+        if soxr is None:
+            return None
+        mono = soxr.resample(mono, sr, 16000)
+    return np.ascontiguousarray(mono, dtype=np.float32)
+
 def to_mono16k(in_path: str) -> str:
     out_path = os.path.join(tempfile.gettempdir(), f"cc_{next(tempfile._get_candidate_names())}.wav")
     if not _have_ffmpeg():
@@ -355,15 +392,215 @@ def to_mono16k(in_path: str) -> str:
     )
     return out_path
 
-# Coqui TTS cache
-_coqui = None
-def _get_coqui():
-    global _coqui
-    if _coqui is None:
-        if CoquiTTS is None:
-            raise RuntimeError("Coqui TTS not installed. pip install TTS soundfile numpy")
-        _coqui = CoquiTTS(model_name=COQUI_MODEL, progress_bar=False, gpu=(DEVICE=="cuda"))
-    return _coqui
+# Coqui TTS job scheduler
+# Flask runs threaded, but a Coqui model must never be driven by two threads at once.
+# Every Coqui synth is queued here and run by one worker thread per model instance,
+# highest priority class first (alarm > command > info), FIFO within a class.
+TTS_PRIO_ALARM   = 0
+TTS_PRIO_COMMAND = 1
+TTS_PRIO_INFO    = 2
+TTS_PRIORITIES   = {"alarm": TTS_PRIO_ALARM, "command": TTS_PRIO_COMMAND, "info": TTS_PRIO_INFO}
+_TTS_PRIO_NAMES  = {v: k for k, v in TTS_PRIORITIES.items()}
+
+COQUI_SPEAKER    = os.environ.get("COQUI_SPEAKER", "p326").strip()
+TTS_WORKERS      = max(1, int(os.environ.get("TTS_WORKERS", "1")))     # model instances
+TTS_QUEUE_MAX    = max(1, int(os.environ.get("TTS_QUEUE_MAX", "8")))   # per priority class
+TTS_SYNTH_TIMEOUT = float(os.environ.get("TTS_SYNTH_TIMEOUT", "30"))  # max wait once a job started
+# Default start deadline per class (ms): a job still queued after this is shed instead of synthesized
+TTS_DEADLINE_MS = {
+    TTS_PRIO_ALARM:   int(os.environ.get("TTS_DEADLINE_ALARM_MS", "20000")),
+    TTS_PRIO_COMMAND: int(os.environ.get("TTS_DEADLINE_COMMAND_MS", "8000")),
+    TTS_PRIO_INFO:    int(os.environ.get("TTS_DEADLINE_INFO_MS", "5000")),
+}
+
+
+class TTSQueueFull(RuntimeError):
+    pass
+
+
+class TTSDeadlineExceeded(RuntimeError):
+    pass
+
+
+def _new_coqui():
+    if CoquiTTS is None:
+        raise RuntimeError("Coqui TTS not installed. pip install TTS soundfile numpy")
+    return CoquiTTS(model_name=COQUI_MODEL, progress_bar=False, gpu=(DEVICE=="cuda"))
+
+
+class _TTSJob:
+    __slots__ = ("prio", "text", "deadline", "enqueued", "done", "result", "error", "cancelled")
+
+    def __init__(self, prio: int, text: str, deadline: float):
+        self.prio = prio
+        self.text = text
+        self.deadline = deadline
+        self.enqueued = time.monotonic()
+        self.done = threading.Event()
+        self.result = None      # (samples, sample_rate)
+        self.error = None
+        self.cancelled = False
+
+
+class TTSScheduler:
+    def __init__(self, workers: int = TTS_WORKERS, queue_max: int = TTS_QUEUE_MAX):
+        self.workers = workers
+        self.queue_max = queue_max
+        self._cv = threading.Condition()
+        self._heap = []                 # (prio, seq, job)
+        self._seq = 0
+        self._threads = []
+        self._busy = 0
+        self._ready = 0
+        self._depth = {p: 0 for p in _TTS_PRIO_NAMES}
+        self._stats = {p: {"submitted": 0, "completed": 0, "failed": 0, "shed_full": 0,
+                           "shed_deadline": 0, "max_depth": 0, "wait_ms_total": 0.0}
+                       for p in _TTS_PRIO_NAMES}
+
+    def start(self):
+        with self._cv:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, args=(i,), name=f"coqui-{i}", daemon=True)
+                self._threads.append(t)
+                t.start()
+
+    def submit(self, text: str, prio: int = TTS_PRIO_INFO, deadline_ms: Optional[int] = None) -> _TTSJob:
+        if prio not in self._depth:
+            prio = TTS_PRIO_INFO
+        budget = TTS_DEADLINE_MS[prio] if deadline_ms is None else max(0, int(deadline_ms))
+        job = _TTSJob(prio, text, time.monotonic() + budget / 1000.0)
+        self.start()
+        with self._cv:
+            st = self._stats[prio]
+            if self._depth[prio] >= self.queue_max:
+                self._shed_expired_locked()
+            if self._depth[prio] >= self.queue_max:
+                st["shed_full"] += 1
+                raise TTSQueueFull(f"{_TTS_PRIO_NAMES[prio]} queue full ({self.queue_max})")
+            self._seq += 1
+            heapq.heappush(self._heap, (prio, self._seq, job))
+            self._depth[prio] += 1
+            st["submitted"] += 1
+            st["max_depth"] = max(st["max_depth"], self._depth[prio])
+            self._cv.notify()
+        return job
+
+    def synth(self, text: str, prio: int = TTS_PRIO_INFO, deadline_ms: Optional[int] = None):
+        """Queue `text` and block until a worker returns (samples, sample_rate)."""
+        job = self.submit(text, prio, deadline_ms)
+        wait = max(0.0, job.deadline - time.monotonic()) + TTS_SYNTH_TIMEOUT
+        if not job.done.wait(wait):
+            job.cancelled = True
+            raise TTSDeadlineExceeded("synthesis timed out")
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def metrics(self) -> dict:
+        with self._cv:
+            classes = {}
+            for p, st in self._stats.items():
+                started = st["completed"] + st["failed"]
+                classes[_TTS_PRIO_NAMES[p]] = {
+                    "depth": self._depth[p],
+                    "max_depth": st["max_depth"],
+                    "submitted": st["submitted"],
+                    "completed": st["completed"],
+                    "failed": st["failed"],
+                    "shed_full": st["shed_full"],
+                    "shed_deadline": st["shed_deadline"],
+                    "avg_wait_ms": round(st["wait_ms_total"] / started, 1) if started else None,
+                }
+            return {
+                "workers": len(self._threads),
+                "workers_ready": self._ready,
+                "busy": self._busy,
+                "queue_max": self.queue_max,
+                "classes": classes,
+            }
+
+    def _shed_expired_locked(self):
+        now = time.monotonic()
+        keep = []
+        for item in self._heap:
+            job = item[2]
+            if job.deadline < now or job.cancelled:
+                self._drop_locked(job)
+            else:
+                keep.append(item)
+        if len(keep) != len(self._heap):
+            heapq.heapify(keep)
+            self._heap = keep
+
+    def _drop_locked(self, job: _TTSJob):
+        self._depth[job.prio] -= 1
+        self._stats[job.prio]["shed_deadline"] += 1
+        job.error = TTSDeadlineExceeded("deadline passed while queued")
+        job.done.set()
+
+    def _next_job(self) -> _TTSJob:
+        with self._cv:
+            while True:
+                while not self._heap:
+                    self._cv.wait()
+                _, _, job = heapq.heappop(self._heap)
+                if job.cancelled or job.deadline < time.monotonic():
+                    self._drop_locked(job)
+                    continue
+                self._depth[job.prio] -= 1
+                self._busy += 1
+                self._stats[job.prio]["wait_ms_total"] += (time.monotonic() - job.enqueued) * 1000.0
+                return job
+
+    def _worker(self, idx: int):
+        try:
+            tts = _new_coqui()
+            if TTS_ENGINE_DEFAULT == "coqui":
+                tts.tts("warmup", speaker=COQUI_SPEAKER)
+            with self._cv:
+                self._ready += 1
+            print(f"[TTS] Coqui worker {idx} ready")
+        except Exception as e:
+            print(f"[TTS] Coqui worker {idx} failed to load: {e}")
+            tts, load_err = None, e
+        while True:
+            job = self._next_job()
+            try:
+                if tts is None:
+                    raise RuntimeError(f"coqui model unavailable: {load_err}")
+                y = tts.tts(job.text, speaker=COQUI_SPEAKER)
+                sr = getattr(getattr(tts, "synthesizer", None), "output_sample_rate", None) or 22050
+                job.result = (y, int(sr))
+                ok = True
+            except Exception as e:
+                job.error = e
+                ok = False
+            with self._cv:
+                self._busy -= 1
+                self._stats[job.prio]["completed" if ok else "failed"] += 1
+            job.done.set()
+
+
+tts_scheduler = TTSScheduler()
+
+
+def _parse_priority(value: Optional[str]) -> int:
+    return TTS_PRIORITIES.get((value or "").strip().lower(), TTS_PRIO_INFO)
+
+
+def _synth_coqui_wav(text: str, wav_path: str, prio: int = TTS_PRIO_INFO,
+                     deadline_ms: Optional[int] = None) -> None:
+    """Synthesize through the scheduler and write mono 16 kHz PCM WAV to wav_path."""
+    y, sr = tts_scheduler.synth(text, prio, deadline_ms)
+    sf.write(wav_path, np.array(y), sr, subtype="PCM_16")
+    tmp16 = wav_path + ".tmp16.wav"
+    subprocess.run(["ffmpeg","-y","-i", wav_path, "-ac","1","-ar","16000", tmp16],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    os.replace(tmp16, wav_path)
+
+UPLOAD_FORMATS = _upload_formats()
 
 # Endpoints
 @app.get("/health")
@@ -378,7 +615,9 @@ def health():
         "gemini_model": GEMINI_MODEL if GEMINI_API_KEY else None,
         "weather_enabled": bool(WEATHERAPI_KEY),
         "maps_enabled": bool(GOOGLE_MAPS_API_KEY),
-        "home_address": HOME_ADDRESS or None
+        "home_address": HOME_ADDRESS or None,
+        "tts_queue": tts_scheduler.metrics(),
+        "upload_formats": UPLOAD_FORMATS,
     })
     return jsonify({
         "status":"ok",
@@ -393,6 +632,50 @@ def health():
         "home_address": HOME_ADDRESS or None
     })
 
+def _save_upload(f) -> str:
+    suffix = os.path.splitext(f.filename or "in.wav")[1] or ".wav"
+    in_fd, in_path = tempfile.mkstemp(suffix=suffix); os.close(in_fd)
+    f.save(in_path)
+    return in_path
+
+def _transcribe_file(in_path: str) -> dict:
+    """ASR + NLU (+ commute plan) for an uploaded audio file; raises on failure."""
+    t0 = time.perf_counter()
+    audio = _load_audio(in_path)
+    if audio is not None:
+        print(f"[transcribe] decoded in-process: {len(audio) / 16000.0:.2f}s "
+              f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    else:
+        audio = to_mono16k(in_path)
+        try:
+            print(f"[transcribe] converted: {audio}, size={os.path.getsize(audio)} "
+                  f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+        except Exception:
+            pass
+
+    # ASR
+    segments, info = model.transcribe(audio, vad_filter=True)
+    segs = [{"start": round(s.start,2), "end": round(s.end,2), "text": s.text} for s in segments]
+    text = "".join(s["text"] for s in segs).strip()
+
+    # NLU (don’t trigger UI here; Pi will)
+    nlu = gemini_nlu(text) or (get_intent(text) or {"intent": "none"})
+
+    if isinstance(nlu, dict) and nlu.get("intent") == "plan_commute":
+        arrival = nlu.get("arrival_time")
+        dest    = nlu.get("destination") or ""
+        prep_m  = nlu.get("prep_minutes")
+        if arrival and dest:
+            nlu["alarm_proposal"] = plan_alarm(arrival, dest, prep_m)
+
+    return {
+        "text": text,
+        "nlu": nlu,
+        "language": info.language,
+        "duration": info.duration,
+        "segments": segs
+    }
+
 @app.post("/transcribe")
 def transcribe():
     f = request.files.get("audio")
@@ -400,9 +683,7 @@ def transcribe():
         return jsonify({"error": "audio file missing (multipart/form-data, field 'audio')"}), 400
 
     # Save upload
-    suffix = os.path.splitext(f.filename or "in.wav")[1] or ".wav"
-    in_fd, in_path = tempfile.mkstemp(suffix=suffix); os.close(in_fd)
-    f.save(in_path)
+    in_path = _save_upload(f)
     try:
         print(f"[transcribe] got upload: {in_path}, size={os.path.getsize(in_path)}")
     except Exception:
@@ -411,43 +692,7 @@ def transcribe():
     try:
         if os.path.getsize(in_path) < 1024:
             return jsonify({"error": "audio file too small/invalid"}), 400
-
-        conv_path = to_mono16k(in_path)
-        try:
-            print(f"[transcribe] converted: {conv_path}, size={os.path.getsize(conv_path)}")
-        except Exception:
-            pass
-
-        # ASR
-        segments, info = model.transcribe(conv_path, vad_filter=True)
-        segs = [{"start": round(s.start,2), "end": round(s.end,2), "text": s.text} for s in segments]
-        text = "".join(s["text"] for s in segs).strip()
-
-        # NLU (don’t trigger UI here; Pi will)
-        nlu = gemini_nlu(text) or (get_intent(text) or {"intent": "none"})
-
-        if isinstance(nlu, dict) and nlu.get("intent") == "plan_commute":
-            arrival = nlu.get("arrival_time")
-            dest    = nlu.get("destination") or ""
-            prep_m  = nlu.get("prep_minutes")
-            if arrival and dest:
-                nlu["alarm_proposal"] = plan_alarm(arrival, dest, prep_m)
-        nlu = gemini_nlu(text) or (get_intent(text) or {"intent": "none"})
-
-        if isinstance(nlu, dict) and nlu.get("intent") == "plan_commute":
-            arrival = nlu.get("arrival_time")
-            dest    = nlu.get("destination") or ""
-            prep_m  = nlu.get("prep_minutes")
-            if arrival and dest:
-                nlu["alarm_proposal"] = plan_alarm(arrival, dest, prep_m)
-
-        return jsonify({
-            "text": text,
-            "nlu": nlu,
-            "language": info.language,
-            "duration": info.duration,
-            "segments": segs
-        })
+        return jsonify(_transcribe_file(in_path))
     except Exception as e:
         return jsonify({"error": f"transcription failed: {type(e).__name__}: {e}"}), 400
     # finally:
@@ -458,10 +703,122 @@ def transcribe():
     #         except Exception:
     #             pass
 
+def _spoken_time(hhmm: str) -> str:
+    t = _parse_hhmm(hhmm or "")
+    if not t:
+        return hhmm or ""
+    h12 = (t.hour % 12) or 12
+    ampm = "PM" if t.hour >= 12 else "AM"
+    return f"{h12}:{t.minute:02d} {ampm}" if t.minute else f"{h12} {ampm}"
+
+def _confirmation_text(result: dict) -> str:
+    """Short spoken confirmation for a /transcribe-style result."""
+    nlu = result.get("nlu") or {}
+    intent = (nlu.get("intent") or "").lower()
+    if intent == "goto" and nlu.get("view"):
+        return f"Showing the {nlu['view']}."
+    if intent == "set_alarm" and nlu.get("alarm_time"):
+        return f"Alarm set for {_spoken_time(nlu['alarm_time'])}."
+    if intent == "plan_commute":
+        prop = nlu.get("alarm_proposal") or {}
+        if prop.get("alarm_time"):
+            plan = prop.get("plan") or {}
+            msg = f"Alarm set for {_spoken_time(prop['alarm_time'])}."
+            if plan.get("travel_minutes"):
+                msg += f" The trip takes about {plan['travel_minutes']} minutes."
+            return msg
+        return "Sorry, I could not plan that trip."
+    if not result.get("text"):
+        return "Sorry, I didn't catch that."
+    return ""
+
+def _multipart_part(boundary: str, ctype: str, body: bytes, name: str) -> bytes:
+    head = (f"--{boundary}\r\n"
+            f"Content-Type: {ctype}\r\n"
+            f"Content-Disposition: inline; name=\"{name}\"\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    return head.encode("ascii") + body + b"\r\n"
+
+@app.post("/converse")
+def converse():
+    """Transcribe + NLU + spoken confirmation in one round trip.
+
+    Response is streamed multipart/mixed: the JSON result part is sent as soon as
+    NLU finishes (so the Pi can act on the command), then an audio/wav part with
+    the confirmation (omitted when there is nothing to say or synthesis fails).
+    """
+    f = request.files.get("audio")
+    if not f or not getattr(f, "filename", ""):
+        return jsonify({"error": "audio file missing (multipart/form-data, field 'audio')"}), 400
+    voice  = (request.form.get("voice") or "en-US-JennyNeural").strip()
+    rate   = (request.form.get("rate")  or "+0%").strip()
+    engine = (request.form.get("engine") or TTS_ENGINE_DEFAULT).strip().lower()
+
+    in_path = _save_upload(f)
+    try:
+        if os.path.getsize(in_path) < 1024:
+            return jsonify({"error": "audio file too small/invalid"}), 400
+        result = _transcribe_file(in_path)
+    except Exception as e:
+        return jsonify({"error": f"transcription failed: {type(e).__name__}: {e}"}), 400
+    finally:
+        try: os.remove(in_path)
+        except: pass
+
+    say = _confirmation_text(result)
+    result["say"] = say
+    boundary = f"cc{next(tempfile._get_candidate_names())}"
+
+    def generate():
+        yield _multipart_part(boundary, "application/json",
+                              json.dumps(result, ensure_ascii=False).encode("utf-8"), "result")
+        if say:
+            fd_wav, wav_path = tempfile.mkstemp(suffix=".wav"); os.close(fd_wav)
+            try:
+                if engine == "coqui":
+                    _synth_coqui_wav(say, wav_path, TTS_PRIO_COMMAND)
+                else:
+                    _synth_edge_wav(say, voice, rate, wav_path)
+                with open(wav_path, "rb") as w:
+                    audio = w.read()
+                yield _multipart_part(boundary, "audio/wav", audio, "audio")
+            except Exception as e:
+                print(f"[converse] tts failed: {e}")
+            finally:
+                try: os.remove(wav_path)
+                except: pass
+        yield f"--{boundary}--\r\n".encode("ascii")
+
+    return Response(generate(), mimetype=f"multipart/mixed; boundary={boundary}")
+
+def _synth_edge_wav(text: str, voice: str, rate: str, wav_path: str) -> None:
+    """Edge-TTS to MP3, then ffmpeg to mono 16 kHz WAV at wav_path."""
+    import edge_tts
+    fd_mp3, mp3_path = tempfile.mkstemp(suffix=".mp3"); os.close(fd_mp3)
+    async def synth_to_mp3():
+        comm = edge_tts.Communicate(text, voice=voice, rate=rate)
+        with open(mp3_path, "wb") as f:
+            async for chunk in comm.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+
+    try:
+        try:
+            asyncio.run(synth_to_mp3())
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(synth_to_mp3()); loop.close()
+
+        subprocess.run(["ffmpeg","-y","-i", mp3_path, "-ac","1","-ar","16000","-f","wav", wav_path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    finally:
+        try: os.remove(mp3_path)
+        except: pass
+
 @app.get("/tts")
 def tts():
     # Minimal TTS endpoint preserved (optional for Pi client)
-    import edge_tts
     text = (request.args.get("text") or "").strip()
     voice = (request.args.get("voice") or "en-US-JennyNeural").strip()
     rate  = (request.args.get("rate")  or "+0%").strip()
@@ -472,15 +829,16 @@ def tts():
     fd_wav, wav_path = tempfile.mkstemp(suffix=".wav"); os.close(fd_wav)
 
     if engine == "coqui":
+        prio = _parse_priority(request.args.get("priority"))
+        deadline_ms = request.args.get("deadline_ms", type=int)
         try:
-            tts = _get_coqui()
-            y = tts.tts(text, speaker="p326")
-            sr = getattr(getattr(tts,"synthesizer",None), "output_sample_rate", None) or 22050
-            sf.write(wav_path, np.array(y), int(sr), subtype="PCM_16")
-            tmp16 = wav_path + ".tmp16.wav"
-            subprocess.run(["ffmpeg","-y","-i", wav_path, "-ac","1","-ar","16000", tmp16],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
-            os.replace(tmp16, wav_path)
+            _synth_coqui_wav(text, wav_path, prio, deadline_ms)
+        except (TTSQueueFull, TTSDeadlineExceeded) as e:
+            try: os.remove(wav_path)
+            except: pass
+            resp = jsonify({"error": f"coqui-tts shed: {e}", "tts_queue": tts_scheduler.metrics()})
+            resp.headers["Retry-After"] = "1"
+            return resp, (503 if isinstance(e, TTSQueueFull) else 504)
         except Exception as e:
             try: os.remove(wav_path)
             except: pass
@@ -491,43 +849,24 @@ def tts():
         return resp
 
     # Edge-tts
-    fd_mp3, mp3_path = tempfile.mkstemp(suffix=".mp3"); os.close(fd_mp3)
-    async def synth_to_mp3():
-        comm = edge_tts.Communicate(text, voice=voice, rate=rate)
-        with open(mp3_path, "wb") as f:
-            async for chunk in comm.stream():
-                if chunk["type"] == "audio":
-                    f.write(chunk["data"])
-
     try:
-        try:
-            asyncio.run(synth_to_mp3())
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(synth_to_mp3()); loop.close()
-
-        subprocess.run(["ffmpeg","-y","-i", mp3_path, "-ac","1","-ar","16000","-f","wav", wav_path],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        _synth_edge_wav(text, voice, rate, wav_path)
         resp = send_file(wav_path, mimetype="audio/wav", as_attachment=False, download_name="out.wav")
         return resp
     except Exception as e:
         return jsonify({"error": f"edge-tts synth failed: {e}"}), 500
     # finally:
-    #     for p in (mp3_path, wav_path):
+    #     for p in (wav_path,):
     #         try: os.remove(p)
     #         except: pass
 
-def _warmup_coqui():
-    try:
-        if TTS_ENGINE_DEFAULT == "coqui":
-            tts = _get_coqui()
-            tts.tts("warmup", speaker="p326")
-            print("[Warmup] Coqui TTS ready")
-    except Exception as e:
-        print(f"[Warmup] Coqui preload failed: {e}")
+@app.get("/tts/metrics")
+def tts_metrics():
+    return jsonify(tts_scheduler.metrics())
 
-threading.Thread(target=_warmup_coqui, daemon=True).start()
+# Preload (and warm up) the Coqui workers when Coqui is the default engine
+if TTS_ENGINE_DEFAULT == "coqui":
+    tts_scheduler.start()
 
 if __name__ == "__main__":
     # Bind to 0.0.0.0 so Pi can reach it
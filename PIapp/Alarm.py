@@ -1,5 +1,6 @@
 ﻿import os
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageDraw, ImageFont
+from .glyph_atlas import get_atlas
 
 WINDOW_W = 1024
 WINDOW_H = 600
@@ -169,9 +170,9 @@ def _draw_text_centered(drw: ImageDraw.ImageDraw, rect, label: str, font):
 
 from typing import Optional, List, Set
 
-def draw_alarm(hour: int, minute: int, enabled: bool, index: int = 1, total: int = 1,
-               alarms: Optional[List] = None, selected: int = 0, checked: Optional[Set] = None) -> ImageTk.PhotoImage:
-    """Return an ImageTk.PhotoImage showing an alarm settings view with buttons."""
+def render_alarm(hour: int, minute: int, enabled: bool, index: int = 1, total: int = 1,
+                 alarms: Optional[List] = None, selected: int = 0, checked: Optional[Set] = None) -> Image.Image:
+    """Return a PIL image showing an alarm settings view with buttons."""
     # Solid white to align with the main clock page background
     img = Image.new("RGB", (WINDOW_W, WINDOW_H), "white")
     drw = ImageDraw.Draw(img)
@@ -195,6 +196,7 @@ def draw_alarm(hour: int, minute: int, enabled: bool, index: int = 1, total: int
     # Display in 12-hour format with AM/PM
     hour12 = (hour % 12) or 12
     time_txt = f"{hour12:02d}:{minute:02d}"
+    atlas = get_atlas(_FONT_PATH, 150)
     try:
         l, t, r, b = drw.textbbox((0, 0), time_txt, font=time_f)
         ww, wh = r - l, b - t
@@ -202,7 +204,12 @@ def draw_alarm(hour: int, minute: int, enabled: bool, index: int = 1, total: int
         ww, wh = drw.textsize(time_txt, font=time_f)
     cx = content_x0 + (content_w - ww) // 2
     cy = (WINDOW_H - wh) // 2 - 40
-    drw.text((cx, cy), time_txt, font=time_f, fill=_COLOR)
+    if atlas is not None and atlas.supports(time_txt):
+        # Cached digit glyphs instead of rasterizing 150 px text on every redraw
+        tile, (gl, gt) = atlas.render(time_txt, _COLOR, "white")
+        img.paste(tile, (cx + gl, cy + gt))
+    else:
+        drw.text((cx, cy), time_txt, font=time_f, fill=_COLOR)
 
     # Draw +/- above/below the hour and minute numbers
     small_f = _font(22)
@@ -264,4 +271,12 @@ def draw_alarm(hour: int, minute: int, enabled: bool, index: int = 1, total: int
             tx_rect = (xcb2 + 8 if cb else x1 + 8, y1, x2 - 6, y2)
             _draw_text_centered(drw, tx_rect, label, _font(22))
 
-    return ImageTk.PhotoImage(img)
+    return img
+
+
+def draw_alarm(hour: int, minute: int, enabled: bool, index: int = 1, total: int = 1,
+               alarms: Optional[List] = None, selected: int = 0, checked: Optional[Set] = None):
+    """Return an ImageTk.PhotoImage showing an alarm settings view with buttons."""
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(render_alarm(hour, minute, enabled, index=index, total=total,
+                                           alarms=alarms, selected=selected, checked=checked))
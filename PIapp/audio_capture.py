@@ -0,0 +1,238 @@
+"""Microphone capture helpers for the wake-word loop (16 kHz mono int16)."""
+
+import sys
+import time
+import wave
+import array
+import threading
+import subprocess
+from typing import Optional
+
+
+class FrameReader:
+    """Read fixed-size int16 frames from a raw PCM byte stream without per-sample Python work.
+
+    One bytearray is allocated up front and refilled with readinto(); read() returns a
+    memoryview cast to 'h' over it, which Porcupine accepts like a list of ints.
+    The returned view is overwritten by the next read() — copy it if you need to keep it.
+    """
+
+    def __init__(self, stream, frame_length: int):
+        self.stream = stream
+        self.frame_length = frame_length
+        self._buf = bytearray(frame_length * 2)
+        self._mv = memoryview(self._buf)
+        self._samples = self._mv.cast("h")
+        self._swap = sys.byteorder != "little"   # arecord S16_LE
+        self._swapped = array.array("h", bytes(len(self._buf))) if self._swap else None
+
+    def read(self) -> Optional[memoryview]:
+        """Return the next frame, or None on EOF/short read (stream hiccup)."""
+        got, need = 0, len(self._buf)
+        while got < need:
+            n = self.stream.readinto(self._mv[got:])
+            if not n:
+                return None
+            got += n
+        if self._swap:
+            self._swapped[:] = array.array("h", self._buf)
+            self._swapped.byteswap()
+            return memoryview(self._swapped)
+        return self._samples
+
+    def frame_bytes(self) -> bytes:
+        """Copy of the last frame as little-endian bytes (for WAV writing)."""
+        return bytes(self._buf)
+
+
+class ArecordSource:
+    """Raw 16 kHz mono S16_LE stream from a long-lived arecord process."""
+
+    def __init__(self, card: str, frame_length: int, rate: int = 16000):
+        self.card = card
+        self.frame_length = frame_length
+        self.rate = rate
+        self._proc = None
+        self._reader = None
+
+    def start(self):
+        cmd = ["arecord", "-D", self.card, "-f", "S16_LE", "-r", str(self.rate), "-c", "1", "-t", "raw", "-q"]
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self._reader = FrameReader(self._proc.stdout, self.frame_length)
+
+    def read(self):
+        pcm = self._reader.read() if self._reader else None
+        if pcm is None:
+            # stream hiccup; restart the process and let the caller retry
+            self.stop()
+            time.sleep(0.1)
+            self.start()
+        return pcm
+
+    def stop(self):
+        proc, self._proc, self._reader = self._proc, None, None
+        if proc:
+            try:
+                proc.terminate()
+                proc.wait(timeout=0.5)
+            except Exception:
+                pass
+
+
+class PvRecorderSource:
+    """Wraps a PvRecorder; make_recorder() must return a started recorder."""
+
+    def __init__(self, make_recorder):
+        self._make = make_recorder
+        self._rec = None
+
+    def start(self):
+        self._rec = self._make()
+
+    def read(self):
+        return self._rec.read()
+
+    def stop(self):
+        rec, self._rec = self._rec, None
+        if rec:
+            try:
+                rec.stop()
+            except Exception:
+                pass
+            try:
+                rec.delete()
+            except Exception:
+                pass
+
+
+class RingBuffer:
+    """Fixed-capacity ring of int16 frames addressed by a monotonically increasing sequence number."""
+
+    def __init__(self, frame_length: int, capacity_frames: int):
+        self.frame_length = frame_length
+        self.capacity = capacity_frames
+        self._data = array.array("h", bytes(frame_length * capacity_frames * 2))
+        self._mv = memoryview(self._data)
+        self._cv = threading.Condition()
+        self.head = 0           # sequence number of the next frame to be written
+        self.closed = False
+
+    def write(self, frame):
+        if not isinstance(frame, (memoryview, array.array)):
+            frame = array.array("h", frame)     # PvRecorder returns a list of ints
+        n = self.frame_length
+        with self._cv:
+            off = (self.head % self.capacity) * n
+            self._mv[off:off + n] = frame
+            self.head += 1
+            self._cv.notify_all()
+
+    def close(self):
+        with self._cv:
+            self.closed = True
+            self._cv.notify_all()
+
+    def oldest(self) -> int:
+        return max(0, self.head - self.capacity)
+
+    def frame(self, seq: int) -> Optional[memoryview]:
+        """View of frame `seq` (valid until the ring wraps over it), or None if evicted/not yet written."""
+        if seq < self.oldest() or seq >= self.head:
+            return None
+        off = (seq % self.capacity) * self.frame_length
+        return self._mv[off:off + self.frame_length]
+
+    def wait_for(self, seq: int, timeout: Optional[float] = None) -> bool:
+        with self._cv:
+            return self._cv.wait_for(lambda: self.head > seq or self.closed, timeout) and self.head > seq
+
+    def pcm_bytes(self, start: int, end: int) -> bytes:
+        """Little-endian int16 bytes of frames [start, end), clamped to what is still buffered."""
+        start = max(start, self.oldest())
+        end = min(end, self.head)
+        out = array.array("h")
+        for seq in range(start, end):
+            out.extend(self.frame(seq))
+        if sys.byteorder != "little":
+            out.byteswap()
+        return out.tobytes()
+
+
+class FrameCursor:
+    """A consumer's read position in a RingBuffer; skips ahead if it falls off the end."""
+
+    def __init__(self, ring: RingBuffer, seq: Optional[int] = None):
+        self.ring = ring
+        self.seq = ring.head if seq is None else seq
+        self.dropped = 0
+
+    def next(self, timeout: Optional[float] = None):
+        """Return (seq, frame view), or (None, None) on timeout/close."""
+        if not self.ring.wait_for(self.seq, timeout):
+            return None, None
+        oldest = self.ring.oldest()
+        if self.seq < oldest:
+            self.dropped += oldest - self.seq
+            self.seq = oldest
+        seq = self.seq
+        self.seq += 1
+        return seq, self.ring.frame(seq)
+
+    def seek_live(self):
+        """Jump to the newest audio (e.g. after blocking on something else)."""
+        self.seq = self.ring.head
+
+
+class CaptureStream:
+    """Single continuous capture: one thread reads the mic into a RingBuffer forever.
+
+    Wake-word detection and utterance recording both read from the ring, so the device is
+    opened once and audio from just before the wake word is still available as pre-roll.
+    """
+
+    def __init__(self, source, frame_length: int, seconds: float = 12.0, rate: int = 16000):
+        self.source = source
+        self.rate = rate
+        self.frame_length = frame_length
+        self.ring = RingBuffer(frame_length, max(8, int(seconds * rate / frame_length)))
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def frame_sec(self) -> float:
+        return self.frame_length / float(self.rate)
+
+    def start(self):
+        self.source.start()
+        self._thread = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._thread.start()
+
+    def cursor(self, seq: Optional[int] = None) -> FrameCursor:
+        return FrameCursor(self.ring, seq)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                pcm = self.source.read()
+            except Exception as e:
+                print(f"[capture] read failed: {e}")
+                time.sleep(0.2)
+                continue
+            if pcm is not None:
+                self.ring.write(pcm)
+        self.ring.close()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        self.source.stop()
+        self.ring.close()
+
+
+def write_wav(path: str, pcm_bytes: bytes, rate: int = 16000):
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm_bytes)
@@ -0,0 +1,103 @@
+"""Optional compression of recorded commands before upload (FLAC / Opus).
+
+The server lists what it can decode under "upload_formats" in /health; the Pi picks the
+smallest format both sides support (VOICE_UPLOAD_FORMAT=auto) or the one forced by env.
+"""
+
+import os
+import time
+import shutil
+import subprocess
+from typing import Optional
+
+import requests
+
+UPLOAD_FORMAT = os.getenv("VOICE_UPLOAD_FORMAT", "auto").strip().lower()   # auto|wav|flac|opus
+OPUS_BITRATE  = os.getenv("VOICE_OPUS_KBPS", "24")                          # speech is fine at 16-32 kbps
+
+_MIME = {"wav": "audio/wav", "flac": "audio/flac", "opus": "audio/ogg"}
+_EXT  = {"wav": ".wav", "flac": ".flac", "opus": ".opus"}
+_PREFERENCE = ("opus", "flac", "wav")     # smallest first
+
+_FAILED_RETRY_SEC = 60.0   # an unreachable /health is retried after this, not on every command
+
+_server_formats = {}   # health URL -> (list, expires); a fetched list never expires
+
+
+def _encoder_cmd(fmt: str, src: str, dst: str) -> Optional[list]:
+    if fmt == "flac":
+        if shutil.which("flac"):
+            return ["flac", "-s", "-f", "-5", "-o", dst, src]
+        if shutil.which("sox"):
+            return ["sox", src, dst]
+    elif fmt == "opus":
+        if shutil.which("opusenc"):
+            return ["opusenc", "--quiet", "--speech", "--bitrate", OPUS_BITRATE, src, dst]
+        if shutil.which("ffmpeg"):
+            return ["ffmpeg", "-y", "-loglevel", "error", "-i", src, "-c:a", "libopus",
+                    "-b:a", f"{OPUS_BITRATE}k", "-application", "voip", dst]
+    return None
+
+
+def local_formats() -> list:
+    return [f for f in _PREFERENCE if f == "wav" or _encoder_cmd(f, "-", "-")]
+
+
+def server_formats(health_url: str) -> list:
+    #Formats the server accepts; older servers without "upload_formats" get plain WAV.
+    hit = _server_formats.get(health_url)
+    if hit is not None and time.time() < hit[1]:
+        return hit[0]
+    try:
+        r = requests.get(health_url, timeout=3)
+        r.raise_for_status()
+        remember_server_formats(health_url, r.json())
+    except Exception as e:
+        print(f"[voice] could not read upload formats from {health_url}: {e}")
+        # Plain WAV for a while, so a down server doesn't cost a 3 s timeout per command
+        _server_formats[health_url] = (["wav"], time.time() + _FAILED_RETRY_SEC)
+    return _server_formats[health_url][0]
+
+
+def remember_server_formats(health_url: str, health: dict):
+    #Reuse a /health response fetched elsewhere (e.g. the server liveness check).
+    _server_formats[health_url] = (health.get("upload_formats") or ["wav"], float("inf"))
+
+
+def choose_format(health_url: str) -> str:
+    if UPLOAD_FORMAT == "wav":
+        return "wav"
+    ours = local_formats()
+    if UPLOAD_FORMAT in _PREFERENCE:
+        wanted = [UPLOAD_FORMAT]
+    else:
+        wanted = list(_PREFERENCE)
+    theirs = server_formats(health_url)
+    for fmt in wanted:
+        if fmt in ours and fmt in theirs:
+            return fmt
+    return "wav"
+
+
+def encode_for_upload(wav_path: str, health_url: str):
+    """Return (path, fmt, mime, stats). path == wav_path when sending WAV (or encoding failed)."""
+    fmt = choose_format(health_url)
+    wav_bytes = os.path.getsize(wav_path)
+    stats = {"format": "wav", "wav_bytes": wav_bytes, "bytes": wav_bytes, "encode_ms": 0.0}
+    if fmt == "wav":
+        return wav_path, "wav", _MIME["wav"], stats
+    out_path = os.path.splitext(wav_path)[0] + _EXT[fmt]
+    t0 = time.perf_counter()
+    try:
+        subprocess.run(_encoder_cmd(fmt, wav_path, out_path), check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=10)
+    except Exception as e:
+        print(f"[voice] {fmt} encode failed, sending WAV: {e}")
+        try:
+            os.remove(out_path)
+        except Exception:
+            pass
+        return wav_path, "wav", _MIME["wav"], stats
+    stats.update(format=fmt, bytes=os.path.getsize(out_path),
+                 encode_ms=(time.perf_counter() - t0) * 1000.0)
+    return out_path, fmt, _MIME[fmt], stats
@@ -0,0 +1,282 @@
+"""Long-lived audio output: one aplay pipe, mixed PCM from TTS and the alarm.
+
+Every sound used to spawn its own aplay/mpg123 and open the ALSA device from scratch.
+AudioSink keeps a single raw-PCM aplay process open and feeds it fixed-size blocks from
+a mixer thread, so starting a sound is just handing over a buffer.
+"""
+
+import os
+import sys
+import time
+import array
+import wave
+import threading
+import subprocess
+from typing import Optional
+
+try:
+    import fcntl
+except Exception:  # Windows
+    fcntl = None
+
+SAMPLE_RATE   = 16000
+BLOCK_MS      = int(os.getenv("AUDIO_BLOCK_MS", "20"))
+LEAD_MS       = int(os.getenv("AUDIO_LEAD_MS", "60"))      # max audio queued ahead of the device
+AUDIO_DEVICE  = os.getenv("AUDIO_DEVICE", "default")        # use a dmix/pulse-backed PCM to share the card
+SINK_ENABLED  = os.getenv("AUDIO_SINK", "1") == "1"
+IDLE_CLOSE_SEC = float(os.getenv("AUDIO_SINK_IDLE_SEC", "3"))  # release the device when quiet; 0 = never
+DUCK_GAIN     = float(os.getenv("AUDIO_DUCK_GAIN", "0.3"))
+# channel -> channel that ducks it while active (alarm beeps drop under speech)
+DUCK_RULES    = {"alarm": "tts"}
+
+_F_SETPIPE_SZ = 1031
+_RETRY_SEC    = 1.0     # wait before respawning aplay after it failed
+_MAX_FAILS    = 2       # consecutive device failures before queued sounds are failed
+
+
+def load_wav_pcm(path: str, rate: int = SAMPLE_RATE) -> Optional[array.array]:
+    #Return mono int16 samples from a WAV file, or None if it isn't mono 16-bit at `rate`.
+    with wave.open(path, "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2 or wf.getframerate() != rate:
+            return None
+        pcm = array.array("h", wf.readframes(wf.getnframes()))
+    if sys.byteorder == "big":
+        pcm.byteswap()
+    return pcm
+
+
+class PlayHandle:
+    """A sound queued on the sink. Mirrors the bits of Popen callers use (poll/terminate/wait)."""
+
+    def __init__(self, pcm: array.array, channel: str, gain: float):
+        self.pcm = pcm
+        self.channel = channel
+        self.gain = gain
+        self.pos = 0
+        self.stopped = False
+        self.failed = False       # the device could not play it (callers may fall back)
+        self._done = threading.Event()
+
+    def poll(self):
+        return None if not self._done.is_set() else (1 if self.stopped else 0)
+
+    def terminate(self):
+        self.stopped = True
+        self._done.set()
+
+    stop = terminate
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _finish(self):
+        self._done.set()
+
+
+class AudioSink:
+    def __init__(self, rate: int = SAMPLE_RATE, block_ms: int = BLOCK_MS, device: str = AUDIO_DEVICE):
+        self.rate = rate
+        self.block = rate * block_ms // 1000
+        self.block_s = self.block / float(rate)
+        self.device = device
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._voices = []
+        self._proc = None
+        self._thread = None
+        self._silence = bytes(self.block * 2)
+        self.level = 0.0          # RMS of the last mixed block (0..32767)
+        self.on_play = []         # callables run (on the caller's thread) whenever a sound is queued
+
+    # ---- public ----
+    def play(self, pcm: array.array, channel: str = "tts", gain: float = 1.0) -> PlayHandle:
+        h = PlayHandle(pcm, channel, gain)
+        with self._lock:
+            self._voices.append(h)
+        self._ensure_thread()
+        self._wake.set()
+        for fn in list(self.on_play):
+            try:
+                fn()
+            except Exception:
+                pass
+        return h
+
+    def stop(self, channel: Optional[str] = None):
+        with self._lock:
+            for v in self._voices:
+                if channel is None or v.channel == channel:
+                    v.terminate()
+
+    def active(self, channel: Optional[str] = None) -> bool:
+        with self._lock:
+            return any(not v.stopped and (channel is None or v.channel == channel) for v in self._voices)
+
+    # ---- device ----
+    def _open(self):
+        cmd = ["aplay", "-q", "-D", self.device, "-t", "raw", "-f", "S16_LE",
+               "-r", str(self.rate), "-c", "1", "--buffer-time", str(LEAD_MS * 1000), "-"]
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, bufsize=0)
+        if fcntl is not None:
+            # Keep the pipe itself small so queued audio stays within a few blocks
+            try:
+                fcntl.fcntl(proc.stdin.fileno(), _F_SETPIPE_SZ, 4096)
+            except Exception:
+                pass
+        return proc
+
+    def _close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.wait(timeout=1.0)
+        except Exception:
+            proc.kill()
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audio-sink", daemon=True)
+                self._thread.start()
+
+    # ---- mixer ----
+    def _mix_block(self) -> bytes:
+        n = self.block
+        with self._lock:
+            live = [v for v in self._voices if not v.stopped]
+            channels = {v.channel for v in live}
+            for v in self._voices:
+                if v.stopped:
+                    v._finish()
+            self._voices = live
+        if not live:
+            self.level = 0.0
+            return self._silence
+
+        parts = []
+        for v in live:
+            chunk = v.pcm[v.pos:v.pos + n]
+            v.pos += n
+            gain = v.gain
+            if DUCK_RULES.get(v.channel) in channels:
+                gain *= DUCK_GAIN
+            parts.append((chunk, gain))
+            if v.pos >= len(v.pcm):
+                with self._lock:
+                    if v in self._voices:
+                        self._voices.remove(v)
+                v._finish()
+
+        if len(parts) == 1 and parts[0][1] == 1.0:
+            out = parts[0][0]
+            if len(out) < n:
+                out = out + array.array("h", bytes((n - len(out)) * 2))
+        else:
+            acc = [0.0] * n
+            for chunk, gain in parts:
+                for i, s in enumerate(chunk):
+                    acc[i] += s * gain
+            out = array.array("h", (32767 if x > 32767 else -32768 if x < -32768 else int(x) for x in acc))
+        # Cheap level estimate on a decimated block
+        step = 8
+        sq = 0
+        for s in out[::step]:
+            sq += s * s
+        self.level = (sq / max(1, len(out) // step)) ** 0.5
+        if sys.byteorder == "big":
+            out = array.array("h", out)
+            out.byteswap()
+        return out.tobytes()
+
+    def _run(self):
+        next_t = time.monotonic()
+        idle_since = None
+        fails = 0
+        opened_at = 0.0
+        while True:
+            if self._proc is not None and self._proc.poll() is not None:
+                # aplay exited on its own (device busy or unplugged)
+                self._close()
+                fails = self._device_failed(fails)
+                continue
+            if self._proc is None:
+                try:
+                    self._proc = self._open()
+                except Exception as e:
+                    print("Audio sink: could not start aplay:", e)
+                    self._fail_all()
+                    self._wake.wait(_RETRY_SEC)
+                    self._wake.clear()
+                    continue
+                opened_at = next_t = time.monotonic()
+            elif fails and time.monotonic() - opened_at > 2 * _RETRY_SEC:
+                fails = 0       # this aplay stayed up: the device works again
+
+            busy = self.active()
+            if busy:
+                idle_since = None
+            elif IDLE_CLOSE_SEC > 0:
+                idle_since = idle_since or time.monotonic()
+                if time.monotonic() - idle_since > IDLE_CLOSE_SEC:
+                    self._close()
+                    idle_since = None
+                    self._wake.clear()
+                    if not self.active():
+                        self._wake.wait()
+                    continue
+
+            data = self._mix_block()
+            try:
+                self._proc.stdin.write(data)
+            except Exception:
+                self._close()
+                fails = self._device_failed(fails)
+                continue
+            # Pace to real time so at most LEAD_MS of audio sits ahead of the device
+            next_t += self.block_s
+            ahead = next_t - time.monotonic() - LEAD_MS / 1000.0
+            if ahead > 0:
+                time.sleep(ahead)
+            elif ahead < -1.0:
+                next_t = time.monotonic()  # fell far behind (suspend/hiccup): resync
+
+    def _device_failed(self, fails: int) -> int:
+        # Back off instead of respawning aplay in a tight loop; after repeated failures stop
+        # holding callers on sounds that can't play so they can fall back
+        fails += 1
+        if fails >= _MAX_FAILS and self.active():
+            print("Audio sink: device unavailable; failing queued sounds")
+            self._fail_all()
+        time.sleep(_RETRY_SEC)
+        return fails
+
+    def _fail_all(self):
+        with self._lock:
+            for v in self._voices:
+                v.failed = True
+                v.terminate()
+            self._voices = []
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_sink() -> Optional[AudioSink]:
+    #Shared sink, or None when disabled or aplay is unavailable (Windows, no alsa-utils).
+    global _sink
+    if not SINK_ENABLED or sys.platform.startswith("win"):
+        return None
+    with _sink_lock:
+        if _sink is None:
+            from shutil import which
+            if which("aplay") is None:
+                return None
+            _sink = AudioSink()
+        return _sink
@@ -0,0 +1,182 @@
+"""Barge-in: let the wake word interrupt speech that is playing in the UI process.
+
+The UI process (which owns the SpeechService and its AudioSink) streams its playback
+level to the voice process over localhost UDP. The voice process keeps running Porcupine
+during playback; when the wake word fires while the clock is talking, the detection is
+only trusted if the mic is clearly louder than the echo expected from that playback
+level. Accepted detections send "stop" back, and the UI cancels command/info speech.
+
+    UI process:     start_ui_link(on_stop)       -> publishes levels, listens for "stop"
+    voice process:  EchoGate().start() ... gate.barge_in()
+"""
+
+import os
+import time
+import socket
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+BARGEIN_ENABLED = os.getenv("VOICE_BARGEIN", "1") == "1"
+LEVEL_PORT      = int(os.getenv("VOICE_BARGEIN_LEVEL_PORT", "47811"))   # UI -> voice: playback level
+CONTROL_PORT    = int(os.getenv("VOICE_BARGEIN_CONTROL_PORT", "47812")) # voice -> UI: "stop"
+ECHO_MARGIN     = float(os.getenv("VOICE_BARGEIN_MARGIN", "1.5"))       # mic must beat expected echo by this
+ECHO_COUPLING   = float(os.getenv("VOICE_ECHO_COUPLING", "0.5"))        # initial speaker->mic gain guess
+_HOST           = "127.0.0.1"
+_PUBLISH_SEC    = 0.02     # one level datagram per sink block while audio plays
+_IDLE_POLL_SEC  = 1.0      # idle wake-up when playback can't notify us (custom get_level)
+_ECHO_WINDOW    = 0.8      # seconds of playback that can still be "in the air" around a detection
+_QUIET_LEVEL    = 50.0     # playback RMS below this counts as silence
+
+
+def _send(sock, port: int, msg: str):
+    try:
+        sock.sendto(msg.encode("ascii"), (_HOST, port))
+    except OSError:
+        pass    # nobody listening; barge-in is best effort
+
+
+def start_ui_link(on_stop: Callable[[], None], get_level: Optional[Callable[[], float]] = None):
+    """Run in the UI process: publish playback level and call on_stop() when barge-in fires.
+
+    get_level defaults to the shared AudioSink's level (0 when idle). Returns the thread,
+    or None when disabled or the control port is already taken.
+
+    While nothing plays the thread just blocks on the control socket. The sink pokes that
+    socket when a sound is queued, and only then does the 20 ms level publishing run.
+    """
+    if not BARGEIN_ENABLED:
+        return None
+    sink = None
+    custom_level = get_level is not None
+    if get_level is None:
+        from .audio_out import get_sink
+        sink = get_sink()
+
+        def get_level():
+            return sink.level if sink is not None and sink.active() else 0.0
+
+    def is_active():
+        if sink is not None:
+            return sink.active()
+        return get_level() > _QUIET_LEVEL
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.bind((_HOST, CONTROL_PORT))
+    except OSError as e:
+        print(f"Barge-in disabled: control port {CONTROL_PORT} unavailable ({e})")
+        sock.close()
+        return None
+    if sink is not None:
+        sink.on_play.append(lambda: _send(sock, CONTROL_PORT, "play"))
+    # The sink wakes us itself; a custom level source has to be polled; with neither there
+    # is nothing to publish and the thread only serves "stop"
+    idle_timeout = _IDLE_POLL_SEC if custom_level else None
+
+    def _loop():
+        was_playing = False
+        while True:
+            sock.settimeout(_PUBLISH_SEC if was_playing or is_active() else idle_timeout)
+            try:
+                data, _ = sock.recvfrom(64)
+                if data.strip() == b"stop":
+                    try:
+                        on_stop()
+                    except Exception as e:
+                        print("Barge-in stop failed:", e)
+            except socket.timeout:
+                pass
+            except OSError:
+                time.sleep(_PUBLISH_SEC)
+            level = get_level()
+            playing = level > _QUIET_LEVEL
+            if playing or was_playing:
+                _send(sock, LEVEL_PORT, f"{time.monotonic():.4f} {level:.1f}")
+            was_playing = playing
+
+    t = threading.Thread(target=_loop, name="bargein-ui", daemon=True)
+    t.start()
+    return t
+
+
+class EchoGate:
+    """Voice-process side: tracks playback level and decides whether a wake word is real.
+
+    observe(mic_rms) is fed every captured frame; while speech plays it learns the
+    speaker->mic coupling (tracking the quietest ratios, so the user's own voice barely
+    moves it). accept(mic_rms) compares the detection window's mic level with the echo that
+    playback alone would produce.
+    """
+
+    def __init__(self):
+        self._levels = deque(maxlen=int(_ECHO_WINDOW / _PUBLISH_SEC) * 4)
+        self._lock = threading.Lock()
+        self.coupling = ECHO_COUPLING
+        self._sock = None
+        self.stats = {"accepted": 0, "rejected": 0, "stops": 0}
+
+    def start(self):
+        if not BARGEIN_ENABLED:
+            return self
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._sock.bind((_HOST, LEVEL_PORT))
+        except OSError as e:
+            print(f"Barge-in: level port {LEVEL_PORT} unavailable ({e}); detection won't be echo-gated")
+            return self
+        threading.Thread(target=self._recv_loop, name="bargein-levels", daemon=True).start()
+        return self
+
+    def _recv_loop(self):
+        while True:
+            try:
+                data, _ = self._sock.recvfrom(64)
+                ts, level = data.split()
+                with self._lock:
+                    self._levels.append((float(ts), float(level)))
+            except Exception:
+                time.sleep(_PUBLISH_SEC)
+
+    def _local_level(self) -> float:
+        # Replies played by this process (/converse) go through our own sink
+        from . import audio_out
+        sink = audio_out._sink
+        return sink.level if sink is not None and sink.active() else 0.0
+
+    def playback_level(self, window: float = _ECHO_WINDOW) -> float:
+        """Loudest playback level over the last `window` seconds (either process)."""
+        cutoff = time.monotonic() - window
+        with self._lock:
+            remote = max((lvl for ts, lvl in self._levels if ts >= cutoff), default=0.0)
+        return max(remote, self._local_level())
+
+    def playing(self) -> bool:
+        return self.playback_level() > _QUIET_LEVEL
+
+    def observe(self, mic_rms: float):
+        level = self.playback_level(_PUBLISH_SEC * 5)
+        if level <= _QUIET_LEVEL:
+            return
+        ratio = mic_rms / level
+        # Fast down / slow up: follows the echo floor rather than speech on top of it
+        a = 0.1 if ratio < self.coupling else 0.005
+        self.coupling += a * (ratio - self.coupling)
+
+    def accept(self, mic_rms: float) -> bool:
+        expected = self.coupling * self.playback_level()
+        ok = expected <= _QUIET_LEVEL or mic_rms > expected * ECHO_MARGIN
+        self.stats["accepted" if ok else "rejected"] += 1
+        if not ok:
+            print(f"[bargein] ignoring wake word: mic {mic_rms:.0f} vs expected echo {expected:.0f}")
+        return ok
+
+    def barge_in(self):
+        """Stop speech in the UI process and in this one."""
+        self.stats["stops"] += 1
+        if self._sock is not None:
+            _send(self._sock, CONTROL_PORT, "stop")
+        from . import audio_out
+        sink = audio_out._sink
+        if sink is not None:
+            sink.stop("tts")
@@ -2,16 +2,10 @@ import calendar
 import time
 import os
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageDraw, ImageFont
 
 # Pandas is optional and only used for the CLI helper that prints a DataFrame.
-# Avoid importing it at module import time so the main UI can run without numpy/pandas.
-try:
-    import pandas as pd  # type: ignore
-    _HAS_PANDAS = True
-except Exception:
-    pd = None  # type: ignore
-    _HAS_PANDAS = False
+# It is imported inside generateCalendar so the main UI never pays for numpy/pandas.
 
 thisYear = int(time.strftime("%Y"))
 thisMonth = int(time.strftime("%m"))
@@ -41,7 +35,11 @@ def generateCalendar(thisYear, thisMonth):
     if missingDaysFromNext < 7:
         fullCalendar.extend(nextMonthDays[:missingDaysFromNext])
         
-    if _HAS_PANDAS:
+    try:
+        import pandas as pd  # type: ignore
+    except Exception:
+        pd = None  # type: ignore
+    if pd is not None:
         df = pd.DataFrame({'Day': fullCalendar})
         df['Year'] = thisYear
         df['Month'] = thisMonth
@@ -91,8 +89,8 @@ def _font(size: int):
     return f
 
 
-def draw_calendar_image(width: int = 1024, height: int = 600, top_margin: int = 20):
-    """Return ImageTk.PhotoImage calendar for the current month.
+def render_calendar_image(width: int = 1024, height: int = 600, top_margin: int = 20) -> Image.Image:
+    """Return the calendar for the current month as a PIL image.
 
     top_margin: extra padding from the very top to avoid overlapping UI chrome.
     """
@@ -146,4 +144,10 @@ def draw_calendar_image(width: int = 1024, height: int = 600, top_margin: int =
             col = 0
             row += 1
 
-    return ImageTk.PhotoImage(img)
+    return img
+
+
+def draw_calendar_image(width: int = 1024, height: int = 600, top_margin: int = 20):
+    """Return ImageTk.PhotoImage calendar for the current month."""
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(render_calendar_image(width, height, top_margin))
@@ -1,6 +1,9 @@
-import tkinter as tk
 import time
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageDraw, ImageFont
+try:
+    from .glyph_atlas import get_atlas
+except ImportError:  # run as a script: python PIapp/clock.py
+    from glyph_atlas import get_atlas
 
 windowWidth = 1024
 windowHeight = 600
@@ -10,6 +13,8 @@ fontPath = "./font/CaviarDreams_Bold.ttf"
 _FONT_CACHE = {}
 _BG_CACHE = {"key": None, "img": None}
 _HHMM_CACHE = {"key": None, "img": None}
+_HHMM_POS = (50, 230)
+_SEC_POS = (920, 410)
 
 
 def _font(size: int):
@@ -31,7 +36,17 @@ def _build_background(date_text: str):
     return img
 
 
+def _glyph_tile(text: str, size: int):
+    atlas = get_atlas(fontPath, size)
+    if atlas is None or not atlas.supports(text):
+        return None
+    return atlas.render(text, "#600000", "white")[0]
+
+
 def _build_hhmm_tile(hhmm: str):
+    tile = _glyph_tile(hhmm, 300)
+    if tile is not None:
+        return tile
     tmp = Image.new("RGB", (1, 1), "white")
     drw = ImageDraw.Draw(tmp)
     try:
@@ -48,6 +63,9 @@ def _build_hhmm_tile(hhmm: str):
 
 
 def _build_sec_tile(sec: str):
+    tile = _glyph_tile(sec, 70)
+    if tile is not None:
+        return tile
     tmp = Image.new("RGB", (1, 1), "white")
     drw = ImageDraw.Draw(tmp)
     try:
@@ -63,7 +81,8 @@ def _build_sec_tile(sec: str):
     return tile
 
 
-def drawClock(dayName, today, currentTime, currentSecond):
+def render_clock(dayName, today, currentTime, currentSecond) -> Image.Image:
+    """Compose the clock page as a PIL image (no Tk needed)."""
     date_text = f"{today} | {dayName}"
     if _BG_CACHE["key"] != date_text:
         _BG_CACHE["img"] = _build_background(date_text)
@@ -74,13 +93,109 @@ def drawClock(dayName, today, currentTime, currentSecond):
         _HHMM_CACHE["key"] = currentTime
 
     base = _BG_CACHE["img"].copy()
-    base.paste(_HHMM_CACHE["img"], (50, 230))
+    base.paste(_HHMM_CACHE["img"], _HHMM_POS)
     sec_tile = _build_sec_tile(currentSecond)
-    base.paste(sec_tile, (920, 410))
-    return ImageTk.PhotoImage(base)
+    base.paste(sec_tile, _SEC_POS)
+    return base
+
+
+def drawClock(dayName, today, currentTime, currentSecond):
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(render_clock(dayName, today, currentTime, currentSecond))
+
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+class ClockFace:
+    """Retained-mode clock page: one persistent PhotoImage, repainted only where it changed.
+
+    Each tick the seconds tile (and HH:MM on the minute) is composed into a small region
+    (background + tiles, exactly what a full redraw would show there) and copied into the
+    persistent image with Tk's `photo copy -to`. The region's PhotoImage is reused per size,
+    so the steady state allocates no Tk images and never copies the 1024x600 background.
+    """
+
+    def __init__(self):
+        # Rasterize (or load) the digit glyphs up front, not on the first tick
+        get_atlas(fontPath, 300)
+        get_atlas(fontPath, 70)
+        self.photo = None
+        self._date = None
+        self._layers = {}       # name -> (PIL tile, (x, y))
+        self._boxes = {}        # name -> bbox last painted
+        self._keys = {}
+        self._tiles = {}        # (w, h) -> reusable ImageTk.PhotoImage
+
+    def _set_layer(self, name, key, build, pos):
+        if self._keys.get(name) == key:
+            return None
+        img = build(key)
+        self._layers[name] = (img, pos)
+        self._keys[name] = key
+        box = (pos[0], pos[1], min(windowWidth, pos[0] + img.width), min(windowHeight, pos[1] + img.height))
+        dirty = _union(self._boxes.get(name), box)
+        self._boxes[name] = box
+        return dirty
+
+    def _compose(self, box):
+        region = _BG_CACHE["img"].crop(box)
+        for img, (x, y) in self._layers.values():
+            region.paste(img, (x - box[0], y - box[1]))
+        return region
+
+    def _blit(self, box):
+        from PIL import ImageTk
+        region = self._compose(box)
+        tile = self._tiles.get(region.size)
+        if tile is None:
+            tile = ImageTk.PhotoImage(region)
+            self._tiles[region.size] = tile
+        else:
+            tile.paste(region)
+        self.photo.tk.call(str(self.photo), "copy", str(tile), "-to", box[0], box[1])
+
+    def render(self, dayName, today, currentTime, currentSecond):
+        """Update the face and return the persistent PhotoImage (same object every call)."""
+        date_text = f"{today} | {dayName}"
+        full = self.photo is None or self._date != date_text
+        if full:
+            if _BG_CACHE["key"] != date_text:
+                _BG_CACHE["img"] = _build_background(date_text)
+                _BG_CACHE["key"] = date_text
+            self._date = date_text
+            self._keys.clear()
+            self._boxes.clear()
+        d1 = self._set_layer("hhmm", currentTime, _build_hhmm_tile, _HHMM_POS)
+        d2 = self._set_layer("sec", currentSecond, _build_sec_tile, _SEC_POS)
+        if full:
+            frame = self._compose((0, 0, windowWidth, windowHeight))
+            if self.photo is None:
+                from PIL import ImageTk
+                self.photo = ImageTk.PhotoImage(frame)
+            else:
+                self.photo.paste(frame)
+            return self.photo
+        # HH:MM can overlap the seconds area, so repaint both regions through _compose
+        for box in (d1, d2):
+            if box is not None:
+                self._blit(box)
+        return self.photo
+
+    def snapshot(self):
+        """Fresh full-size PIL copy of what the face currently shows (None before the first render)."""
+        if self.photo is None:
+            return None
+        return self._compose((0, 0, windowWidth, windowHeight))
 
 
 def run(fullscreen=True):
+    import tkinter as tk
     root = tk.Tk()
     root.title("ClockPage")
     root.geometry(f"{windowWidth}x{windowHeight}")
@@ -92,17 +207,21 @@ def run(fullscreen=True):
     canvas.create_line(0, 0, windowWidth, 0, fill="#600000")
 
     clockLabel = tk.Label(root)
+    clockLabel.image = None
     clockLabel.pack()
 
+    face = ClockFace()
+
     def updateTime():
         dayName = time.strftime("%a")
         today = time.strftime("%Y/%m/%d")
         currentTime = time.strftime("%H:%M")
         currentSecond = time.strftime("%S")
 
-        clockImage = drawClock(dayName, today, currentTime, currentSecond)
-        clockLabel.config(image=clockImage)
-        clockLabel.image = clockImage
+        clockImage = face.render(dayName, today, currentTime, currentSecond)
+        if clockLabel.image is not clockImage:
+            clockLabel.config(image=clockImage)
+            clockLabel.image = clockImage
         root.after(1000, updateTime)
 
     def close_window(event=None):
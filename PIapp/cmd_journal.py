@@ -0,0 +1,156 @@
+"""Append-only voice -> UI command journal (JSON lines with sequence numbers).
+
+Writers append one record per command under an flock, so bursts from several processes
+keep their order and nothing is overwritten. The UI remembers its byte offset and the
+last sequence number it applied, and reads every new record in one batch. The file
+lives on tmpfs (/dev/shm) and is never fsync'd: commands only matter while the device
+is up, and this keeps SD-card writes out of the voice path. The UI compacts the file
+once it has consumed everything. The replacement file starts with a marker record that
+carries the last sequence number, so numbering continues.
+
+The UI bus socket is only a wake-up poke; the journal is the source of truth.
+"""
+
+import os
+import json
+import time
+import tempfile
+from typing import List
+
+try:
+    import fcntl
+except Exception:  # Windows: single writer assumed
+    fcntl = None
+
+_SHM = "/dev/shm"
+VOICE_JOURNAL = os.getenv("VOICE_JOURNAL", os.path.join(
+    _SHM if os.path.isdir(_SHM) else tempfile.gettempdir(), "cc_voice_cmds.jsonl"))
+COMPACT_BYTES = int(os.getenv("VOICE_JOURNAL_COMPACT_BYTES", str(64 * 1024)))
+MAX_AGE_SEC   = float(os.getenv("VOICE_JOURNAL_MAX_AGE", "30"))   # ignore older commands at UI startup
+
+
+def _lock(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _open_locked(path: str) -> int:
+    """Open + lock the current journal file, retrying if compaction swapped it underneath us."""
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o666)
+        _lock(fd)
+        try:
+            if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                return fd
+        except FileNotFoundError:
+            pass
+        _unlock(fd)
+        os.close(fd)
+
+
+def _last_seq(fd) -> int:
+    size = os.fstat(fd).st_size
+    if size == 0:
+        return 0
+    start = max(0, size - 4096)
+    os.lseek(fd, start, os.SEEK_SET)
+    tail = os.read(fd, size - start)
+    for line in reversed(tail.split(b"\n")):
+        try:
+            return int(json.loads(line)["seq"])
+        except Exception:
+            continue
+    return 0
+
+
+def append(payload: dict, path: str = VOICE_JOURNAL) -> int:
+    """Append one command; returns its sequence number."""
+    fd = _open_locked(path)
+    try:
+        seq = _last_seq(fd) + 1
+        rec = {"seq": seq, "ts": round(time.time(), 3), "cmd": payload}
+        os.write(fd, json.dumps(rec, ensure_ascii=False).encode("utf-8") + b"\n")
+        return seq
+    finally:
+        _unlock(fd)
+        os.close(fd)
+
+
+def post(payload: dict) -> bool:
+    """Journal a command and poke the UI. False if the journal could not be written."""
+    from .ui_bus import poke
+    try:
+        append(payload)
+    except OSError as e:
+        print(f"[journal] append failed: {e}")
+        return False
+    poke()
+    return True
+
+
+class JournalReader:
+    """UI side: tracks (inode, byte offset, last seq) and returns new commands in order."""
+
+    def __init__(self, path: str = VOICE_JOURNAL, max_age: float = MAX_AGE_SEC):
+        self.path = path
+        self.since = time.time() - max_age
+        self.offset = 0
+        self.inode = None
+        self.last_seq = 0
+        self.partial = b""
+
+    def read_batch(self) -> List[dict]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            # New or compacted file: rescan it; seq numbers filter what was already applied
+            self.inode, self.offset, self.partial = st.st_ino, 0, b""
+        if st.st_size == self.offset:
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        self.offset += len(data)
+        data = self.partial + data
+        lines = data.split(b"\n")
+        self.partial = lines.pop()        # incomplete last line (writer mid-append)
+        out = []
+        for line in lines:
+            try:
+                rec = json.loads(line)
+                seq = int(rec["seq"])
+            except Exception:
+                continue
+            if seq <= self.last_seq:
+                continue
+            if self.last_seq and seq != self.last_seq + 1 and not rec.get("compacted"):
+                print(f"[journal] gap: expected seq {self.last_seq + 1}, got {seq}")
+            self.last_seq = seq
+            cmd = rec.get("cmd")
+            if isinstance(cmd, dict) and rec.get("ts", 0) >= self.since:
+                out.append(cmd)
+        if self.offset >= COMPACT_BYTES and not self.partial:
+            self.compact()
+        return out
+
+    def compact(self):
+        """Replace a fully consumed journal with a one-line marker carrying last_seq."""
+        fd = _open_locked(self.path)
+        try:
+            if os.fstat(fd).st_size != self.offset:
+                return          # a writer got in first; try again after the next read
+            tmp = self.path + ".tmp"
+            marker = {"seq": self.last_seq, "ts": round(time.time(), 3), "compacted": True}
+            with open(tmp, "wb") as f:
+                f.write(json.dumps(marker).encode("utf-8") + b"\n")
+            os.replace(tmp, self.path)
+        finally:
+            _unlock(fd)
+            os.close(fd)
@@ -0,0 +1,165 @@
+"""Pre-rasterized digit glyphs for the clock and alarm time displays.
+
+Each atlas holds anti-aliased masks for "0123456789:" at one font size, plus their
+bearings, advances and pair kerning. Time strings are composed by pasting the masks
+in a single colour, so FreeType is not used on the steady-state render path. Atlases
+are built once per (font, size). They are also saved to GLYPH_CACHE_DIR, so later
+starts skip rasterization entirely. Composed strings are memoized per colour.
+"""
+
+import os
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+GLYPHS = "0123456789:"
+GLYPH_CACHE_DIR = os.getenv("GLYPH_CACHE_DIR", os.path.join(os.path.dirname(__file__), "tmp", "glyphs"))
+_RENDER_CACHE_MAX = 256     # composed strings kept (60 seconds + a day's worth of HH:MM churn is fine)
+
+_ATLASES = {}
+
+
+class GlyphAtlas:
+    def __init__(self, font_path: str, size: int):
+        self.font_path = font_path
+        self.size = size
+        self.masks = {}       # ch -> L image
+        self.bearing = {}     # ch -> (left, top) of the mask relative to the pen origin
+        self.advance = {}     # ch -> float
+        self.kern = {}        # (a, b) -> float adjustment between the pair
+        self._rendered = OrderedDict()
+        if not self._load():
+            self._build()
+            self._save()
+
+    # ---- build / persist ----
+    def _cache_path(self) -> Optional[str]:
+        if not GLYPH_CACHE_DIR:
+            return None
+        try:
+            st = os.stat(self.font_path)
+            ident = f"{os.path.abspath(self.font_path)}|{st.st_size}|{int(st.st_mtime)}|{self.size}|{GLYPHS}"
+        except OSError:
+            return None
+        return os.path.join(GLYPH_CACHE_DIR, hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16])
+
+    def _build(self):
+        try:
+            font = ImageFont.truetype(self.font_path, self.size)
+        except Exception:
+            font = ImageFont.load_default()
+        for ch in GLYPHS:
+            l, t, r, b = font.getbbox(ch)
+            mask = Image.new("L", (max(1, r - l), max(1, b - t)), 0)
+            ImageDraw.Draw(mask).text((-l, -t), ch, font=font, fill=255)
+            self.masks[ch] = mask
+            self.bearing[ch] = (l, t)
+            self.advance[ch] = font.getlength(ch)
+        for a in GLYPHS:
+            for b in GLYPHS:
+                k = font.getlength(a + b) - self.advance[a] - self.advance[b]
+                if abs(k) >= 0.5:
+                    self.kern[(a, b)] = k
+
+    def _save(self):
+        base = self._cache_path()
+        if base is None:
+            return
+        try:
+            os.makedirs(GLYPH_CACHE_DIR, exist_ok=True)
+            w = sum(m.width for m in self.masks.values())
+            h = max(m.height for m in self.masks.values())
+            sheet = Image.new("L", (w, h), 0)
+            meta = {"glyphs": {}, "kern": [[a, b, k] for (a, b), k in self.kern.items()]}
+            x = 0
+            for ch in GLYPHS:
+                m = self.masks[ch]
+                sheet.paste(m, (x, 0))
+                meta["glyphs"][ch] = {"x": x, "w": m.width, "h": m.height,
+                                      "bearing": self.bearing[ch], "advance": self.advance[ch]}
+                x += m.width
+            sheet.save(base + ".png")
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except Exception as e:
+            print("Glyph atlas: could not save cache:", e)
+
+    def _load(self) -> bool:
+        base = self._cache_path()
+        if base is None or not os.path.exists(base + ".json"):
+            return False
+        try:
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with Image.open(base + ".png") as sheet:
+                sheet = sheet.convert("L")
+                for ch, g in meta["glyphs"].items():
+                    self.masks[ch] = sheet.crop((g["x"], 0, g["x"] + g["w"], g["h"]))
+                    self.bearing[ch] = tuple(g["bearing"])
+                    self.advance[ch] = g["advance"]
+            self.kern = {(a, b): k for a, b, k in meta["kern"]}
+            return set(self.masks) >= set(GLYPHS)
+        except Exception:
+            self.masks.clear()
+            return False
+
+    # ---- layout / compose ----
+    def supports(self, text: str) -> bool:
+        return all(ch in self.masks for ch in text)
+
+    def _layout(self, text: str):
+        pen = 0.0
+        out = []
+        for i, ch in enumerate(text):
+            l, t = self.bearing[ch]
+            out.append((ch, int(round(pen)) + l, t))
+            pen += self.advance[ch]
+            if i + 1 < len(text):
+                pen += self.kern.get((ch, text[i + 1]), 0.0)
+        return out
+
+    def bbox(self, text: str) -> Tuple[int, int, int, int]:
+        """Same contract as ImageDraw.textbbox((0, 0), text)."""
+        boxes = [(x, y, x + self.masks[ch].width, y + self.masks[ch].height)
+                 for ch, x, y in self._layout(text)]
+        if not boxes:
+            return (0, 0, 0, 0)
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+    def render(self, text: str, fill, background) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Tightly cropped RGB tile of `text` plus its (left, top) offset from the text origin.
+
+        The returned image is shared (memoized); don't draw on it.
+        """
+        key = (text, fill, background)
+        hit = self._rendered.get(key)
+        if hit is not None:
+            self._rendered.move_to_end(key)
+            return hit
+        l, t, r, b = self.bbox(text)
+        tile = Image.new("RGB", (max(1, r - l), max(1, b - t)), background)
+        for ch, x, y in self._layout(text):
+            tile.paste(fill, (x - l, y - t), self.masks[ch])
+        hit = (tile, (l, t))
+        self._rendered[key] = hit
+        if len(self._rendered) > _RENDER_CACHE_MAX:
+            self._rendered.popitem(last=False)
+        return hit
+
+
+def get_atlas(font_path: str, size: int) -> Optional[GlyphAtlas]:
+    """Shared atlas for (font_path, size), or None if it cannot be built (callers draw text instead)."""
+    key = (font_path, size)
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        try:
+            atlas = GlyphAtlas(font_path, size)
+        except Exception as e:
+            print(f"Glyph atlas unavailable for {font_path}@{size}: {e}")
+            atlas = False
+        _ATLASES[key] = atlas
+    return atlas or None
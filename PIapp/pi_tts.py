@@ -5,41 +5,89 @@ import shlex
 import time
 import tempfile
 import subprocess
+import threading
+import heapq
+import hashlib
+import string
+import wave
+import array
+from collections import OrderedDict
+from concurrent.futures import Future
 from urllib.parse import urlencode
 from typing import Optional
 
 import requests
 
+from .audio_out import get_sink, load_wav_pcm
+
 
 SERVER_URL = os.getenv("TTS_SERVER_URL", "http://10.0.0.111:5000").rstrip("/")
 DEFAULT_VOICE = os.getenv("TTS_VOICE", "en-US-JennyNeural")
 DEFAULT_RATE  = os.getenv("TTS_RATE", "+0%")
 TTS_ENGINE    = os.getenv("TTS_ENGINE", "coqui").strip().lower()
 
-def _play_with_mpg123(path: str) -> bool:
-    #Return True if played successfully.
+# Speech priorities (lower value = more important), matching the server's /tts ?priority classes
+PRIO_ALARM   = 0
+PRIO_COMMAND = 1
+PRIO_INFO    = 2
+_PRIO_NAMES  = {PRIO_ALARM: "alarm", PRIO_COMMAND: "command", PRIO_INFO: "info"}
+
+# Local phrase cache (set TTS_CACHE_MB=0 to disable)
+CACHE_DIR       = os.getenv("TTS_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tmp", "tts_cache"))
+CACHE_MAX_BYTES = int(float(os.getenv("TTS_CACHE_MB", "32")) * 1024 * 1024)
+_PARTIAL_PREFIX = ".dl-"       # downloads in progress; never indexed as cache entries
+# Fixed UI phrases warmed at startup so they play instantly and offline
+PREFETCH_PHRASES = [
+    "Companion Clock is ready.",
+    "Alarm ringing.",
+    "Showing the clock.",
+    "Showing the weather.",
+    "Showing the calendar.",
+    "Showing the alarm.",
+    "Sorry, I didn't catch that.",
+]
+
+def _run_player(cmd, on_spawn=None) -> bool:
+    #Run a player process to completion; on_spawn(proc) lets callers keep a handle to stop it.
     try:
-        subprocess.run(["mpg123", "-q", "--no-gap", path],
-                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception:
         return False
+    if on_spawn:
+        on_spawn(proc)
+    return proc.wait() == 0
 
 
-def _play_with_aplay(path: str) -> bool:
-    #Fallback for WAV.
-    try:
-        subprocess.run(["aplay", "-q", path],
-                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except Exception:
+def _play_with_sink(pcm, on_spawn=None) -> bool:
+    #Play int16 PCM through the shared audio sink; False if the sink is unavailable or the device failed.
+    #A sound stopped on purpose (barge-in, cancel) still counts as played.
+    sink = get_sink()
+    if sink is None:
         return False
+    h = sink.play(pcm, channel="tts")
+    if on_spawn:
+        on_spawn(h)
+    h.wait()
+    return not h.failed
 
 
-def _download_tts(text: str, voice: str, rate: str) -> str:
-    #Call PC /tts and store audio to a temp file.
+def _play_with_mpg123(path: str, on_spawn=None) -> bool:
+    #Return True if played successfully.
+    return _run_player(["mpg123", "-q", "--no-gap", path], on_spawn)
+
+
+def _play_with_aplay(path: str, on_spawn=None) -> bool:
+    #Fallback for WAV.
+    return _run_player(["aplay", "-q", path], on_spawn)
+
+
+def _download_tts(text: str, voice: str, rate: str, priority: int = None, dir: str = None) -> str:
+    #Call PC /tts and store audio to a temp file (in `dir` if given, else the system temp dir).
     #Returns local file path (.mp3 or .wav). Raises on error.
     params = {"text": text, "voice": voice, "engine": TTS_ENGINE}
+    # Server queues Coqui jobs by priority class (alarm > command > info)
+    if priority is not None:
+        params["priority"] = _PRIO_NAMES.get(priority, "info")
     # Some servers ignore rate, but passing it is harmless
     if rate:
         params["rate"] = rate
@@ -51,7 +99,7 @@ def _download_tts(text: str, voice: str, rate: str) -> str:
         ctype = r.headers.get("Content-Type", "").lower()
         suffix = ".mp3" if "audio/mpeg" in ctype or ctype.endswith("mpeg") else ".wav"
 
-        fd, out_path = tempfile.mkstemp(suffix=suffix)
+        fd, out_path = tempfile.mkstemp(prefix=_PARTIAL_PREFIX, suffix=suffix, dir=dir)
         os.close(fd)
 
         with open(out_path, "wb") as f:
@@ -80,39 +128,580 @@ def _download_tts(text: str, voice: str, rate: str) -> str:
     return out_path
 
 
+class PhraseCache:
+    """On-disk TTS audio cache keyed by (text, voice, rate, engine), LRU-evicted by size.
+
+    File mtime is the LRU clock, so recency survives restarts; hits touch the file.
+    """
+
+    def __init__(self, root: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()    # key -> (path, size), oldest first
+        self._total = 0
+        self._fetching = {}            # key -> Lock, so concurrent misses download once
+        self._loaded = False
+
+    @staticmethod
+    def key(text: str, voice: str, rate: str, engine: str = TTS_ENGINE) -> str:
+        raw = "\x1f".join((text, voice, rate, engine)).encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    def _load_locked(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            entries = []
+            for name in os.listdir(self.root):
+                if name.startswith(_PARTIAL_PREFIX):
+                    # Left behind by a crash or power cut (a fresh one may be another process's)
+                    p = os.path.join(self.root, name)
+                    try:
+                        if time.time() - os.path.getmtime(p) > 600:
+                            os.remove(p)
+                    except Exception:
+                        pass
+                    continue
+                k, ext = os.path.splitext(name)
+                if ext not in (".wav", ".mp3"):
+                    continue
+                p = os.path.join(self.root, name)
+                st = os.stat(p)
+                entries.append((st.st_mtime, k, p, st.st_size))
+        except Exception as e:
+            print("TTS cache unavailable:", e)
+            return
+        for _, k, p, size in sorted(entries):
+            self._index[k] = (p, size)
+            self._total += size
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            self._load_locked()
+            hit = self._index.get(key)
+            if hit is None:
+                return None
+            path = hit[0]
+            if not os.path.exists(path):
+                self._total -= hit[1]
+                del self._index[key]
+                return None
+            self._index.move_to_end(key)
+        try:
+            os.utime(path, None)
+        except Exception:
+            pass
+        return path
+
+    def put(self, key: str, src_path: str) -> str:
+        #Move a downloaded file into the cache and evict least-recently-used entries.
+        ext = os.path.splitext(src_path)[1] or ".wav"
+        dst = os.path.join(self.root, key + ext)
+        size = os.path.getsize(src_path)
+        with self._lock:
+            self._load_locked()
+            os.makedirs(self.root, exist_ok=True)
+            os.replace(src_path, dst)
+            old = self._index.pop(key, None)
+            if old:
+                self._total -= old[1]
+            self._index[key] = (dst, size)
+            self._total += size
+            while self._total > self.max_bytes and len(self._index) > 1:
+                _, (p, sz) = self._index.popitem(last=False)
+                self._total -= sz
+                try:
+                    os.remove(p)
+                except Exception:
+                    pass
+        return dst
+
+    def fetch(self, text: str, voice: str, rate: str, priority: int = None) -> str:
+        key = self.key(text, voice, rate)
+        path = self.get(key)
+        if path:
+            return path
+        with self._lock:
+            lk = self._fetching.setdefault(key, threading.Lock())
+        with lk:
+            path = self.get(key)    # another thread may have just downloaded it
+            if path:
+                return path
+            src = None
+            try:
+                # Download inside the cache dir so put() is a same-filesystem rename
+                # (/tmp is often tmpfs, where os.replace into the SD card fails with EXDEV)
+                os.makedirs(self.root, exist_ok=True)
+                src = _download_tts(text, voice=voice, rate=rate, priority=priority, dir=self.root)
+                return self.put(key, src)
+            except Exception:
+                if src and os.path.exists(src):
+                    try:
+                        os.remove(src)
+                    except Exception:
+                        pass
+                raise
+            finally:
+                with self._lock:
+                    self._fetching.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._load_locked()
+            return {"entries": len(self._index), "bytes": self._total, "max_bytes": self.max_bytes}
+
+
+_cache = PhraseCache() if CACHE_MAX_BYTES > 0 else None
+
+
+def fetch_audio(text: str, voice: str, rate: str, priority: int = None):
+    #Return (path, is_temp). Cached files are shared and must not be deleted by the caller.
+    if _cache is not None:
+        try:
+            return _cache.fetch(text, voice, rate, priority), False
+        except Exception as e:
+            print("TTS cache error, downloading directly:", e)
+    return _download_tts(text, voice=voice, rate=rate, priority=priority), True
+
+
+def prefetch(phrases=None, voice: Optional[str] = None, rate: Optional[str] = None) -> Optional[threading.Thread]:
+    #Warm the phrase cache in the background so these play without a server round trip.
+    if _cache is None:
+        return None
+    voice = (voice or DEFAULT_VOICE).strip()
+    rate  = (rate or DEFAULT_RATE).strip()
+    phrases = list(PREFETCH_PHRASES + template_units() if phrases is None else phrases)
+
+    def _run():
+        warmed = 0
+        for text in phrases:
+            try:
+                _cache.fetch(text, voice, rate, PRIO_INFO)
+                warmed += 1
+            except Exception as e:
+                print(f"TTS prefetch stopped ({warmed}/{len(phrases)}): {e}")
+                return
+        print(f"TTS prefetch done ({warmed} phrases, {_cache.stats()['bytes'] // 1024} KiB cached)")
+
+    t = threading.Thread(target=_run, name="tts-prefetch", daemon=True)
+    t.start()
+    return t
+
+
+def play_file(path: str, on_spawn=None) -> None:
+    #Play a local .mp3/.wav file; raises if no player succeeded.
+    # Try MP3 first; if that fails and file is WAV, aplay will succeed.
+    played = False
+    if path.lower().endswith(".wav") and get_sink() is not None:
+        try:
+            pcm = load_wav_pcm(path)
+        except Exception:
+            pcm = None
+        if pcm is not None and _play_with_sink(pcm, on_spawn):
+            return
+    if path.lower().endswith(".mp3"):
+        played = _play_with_mpg123(path, on_spawn)
+        if not played:
+            # If mpg123 missing, user will see nothing; try aplay anyway (some builds support MP3 via plugins).
+            played = _play_with_aplay(path, on_spawn)
+    else:
+        played = _play_with_aplay(path, on_spawn)
+
+    if not played:
+        raise RuntimeError("No audio player succeeded (mpg123/aplay).")
+
+
 def speak(text: str, voice: Optional[str] = None, rate: Optional[str] = None) -> None:
-    #High-level helper: fetch audio from server, play it, and clean up.
+    #High-level helper: fetch audio (phrase cache or server), play it, and clean up.
     if not text or not text.strip():
         return
 
     voice = (voice or DEFAULT_VOICE).strip()
     rate  = (rate or DEFAULT_RATE).strip()
 
-    path = None
+    path, temp = None, False
     try:
-        path = _download_tts(text.strip(), voice=voice, rate=rate)
-
-        # Try MP3 first; if that fails and file is WAV, aplay will succeed.
-        played = False
-        if path.lower().endswith(".mp3"):
-            played = _play_with_mpg123(path)
-            if not played:
-                # If mpg123 missing, user will see nothing; try aplay anyway (some builds support MP3 via plugins).
-                played = _play_with_aplay(path)
-        else:
-            played = _play_with_aplay(path)
-
-        if not played:
-            raise RuntimeError("No audio player succeeded (mpg123/aplay).")
-
+        path, temp = fetch_audio(text.strip(), voice=voice, rate=rate)
+        play_file(path)
     finally:
-        if path:
+        if path and temp:
             try:
                 os.remove(path)
             except Exception:
                 pass
 
 
+class SpeechInterrupted(Exception):
+    pass
+
+
+class _SpeechJob:
+    __slots__ = ("priority", "key", "text", "voice", "rate", "units", "future", "proc", "interrupted")
+
+    def __init__(self, priority: int, text: str, voice: str, rate: str, units=None):
+        self.priority = priority
+        self.key = (text, voice, rate)
+        self.text = text
+        self.voice = voice
+        self.rate = rate
+        self.units = units      # pre-synthesized phrase units for templated announcements
+        self.future = Future()
+        self.proc = None
+        self.interrupted = False
+
+
+class SpeechService:
+    """Background speech queue: one worker downloads and plays, most important first.
+
+    say() returns a concurrent.futures.Future that resolves to True when the phrase was
+    played, or raises SpeechInterrupted if it was pre-empted mid-playback.
+    """
+
+    def __init__(self):
+        self._cv = threading.Condition()
+        self._heap = []          # (priority, seq, job)
+        self._seq = 0
+        self._pending = {}       # key -> job, for de-duplication
+        self._current = None
+        self._thread = None
+
+    def say(self, text: str, priority: int = PRIO_INFO, voice: Optional[str] = None,
+            rate: Optional[str] = None, interrupt: bool = False, units=None) -> Future:
+        text = (text or "").strip()
+        voice = (voice or DEFAULT_VOICE).strip()
+        rate  = (rate or DEFAULT_RATE).strip()
+        if not text:
+            fut = Future()
+            fut.set_result(False)
+            return fut
+        with self._cv:
+            if interrupt:
+                # Pre-empt anything at the same or a lower priority
+                cur = self._current
+                if cur is not None and cur.priority >= priority:
+                    self._stop_locked(cur)
+            job = self._pending.get((text, voice, rate))
+            if job is not None and not job.future.done():
+                if priority < job.priority:
+                    # Same phrase already queued: promote it instead of queueing a duplicate
+                    job.priority = priority
+                    self._push_locked(job)
+                return job.future
+            job = _SpeechJob(priority, text, voice, rate, units)
+            self._pending[job.key] = job
+            self._push_locked(job)
+            self._ensure_worker_locked()
+            return job.future
+
+    def cancel(self, future: Future) -> bool:
+        """Drop a queued phrase, or stop it if it is playing."""
+        with self._cv:
+            cur = self._current
+            if cur is not None and cur.future is future:
+                self._stop_locked(cur)
+                return True
+        return future.cancel()
+
+    def cancel_all(self, min_priority: int = PRIO_ALARM):
+        """Cancel queued and playing speech with priority value >= min_priority."""
+        with self._cv:
+            for job in list(self._pending.values()):
+                if job.priority >= min_priority:
+                    job.future.cancel()
+            cur = self._current
+            if cur is not None and cur.priority >= min_priority:
+                self._stop_locked(cur)
+
+    def stop_current(self) -> bool:
+        with self._cv:
+            cur = self._current
+            if cur is None:
+                return False
+            self._stop_locked(cur)
+            return True
+
+    def _push_locked(self, job: _SpeechJob):
+        self._seq += 1
+        heapq.heappush(self._heap, (job.priority, self._seq, job))
+        self._cv.notify()
+
+    def _stop_locked(self, job: _SpeechJob):
+        job.interrupted = True
+        if job.proc is not None and job.proc.poll() is None:
+            try:
+                job.proc.terminate()
+            except Exception:
+                pass
+
+    def _ensure_worker_locked(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="speech", daemon=True)
+            self._thread.start()
+
+    def _next_job(self) -> _SpeechJob:
+        with self._cv:
+            while True:
+                while not self._heap:
+                    self._cv.wait()
+                prio, _, job = heapq.heappop(self._heap)
+                if prio != job.priority:
+                    continue  # stale entry left behind by a promotion
+                if self._pending.get(job.key) is job:
+                    del self._pending[job.key]
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                self._current = job
+                return job
+
+    def _on_spawn(self, job: _SpeechJob, proc):
+        with self._cv:
+            job.proc = proc
+            if job.interrupted:
+                self._stop_locked(job)
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            path, temp = None, False
+            try:
+                if job.units:
+                    try:
+                        sr, pcm = render_units(job.units, job.voice, job.rate)
+                        sink = get_sink()
+                        if sink is not None and sr == sink.rate:
+                            # Joined buffer goes straight to the device, no temp file
+                            played = _play_with_sink(pcm, on_spawn=lambda p, j=job: self._on_spawn(j, p))
+                            if job.interrupted:
+                                raise SpeechInterrupted(job.text)
+                            if played:
+                                job.future.set_result(True)
+                                continue
+                            # Device failed: write the WAV and let play_file fall back to aplay
+                        fd, path = tempfile.mkstemp(suffix=".wav")
+                        os.close(fd)
+                        temp = True
+                        _write_wav(path, sr, pcm)
+                    except SpeechInterrupted:
+                        raise
+                    except Exception as e:
+                        print(f"Announcement fast path failed, synthesizing full text: {e}")
+                        if path:
+                            try:
+                                os.remove(path)
+                            except Exception:
+                                pass
+                        path = None
+                if path is None:
+                    path, temp = fetch_audio(job.text, voice=job.voice, rate=job.rate, priority=job.priority)
+                if job.interrupted:
+                    raise SpeechInterrupted(job.text)
+                try:
+                    play_file(path, on_spawn=lambda p, j=job: self._on_spawn(j, p))
+                except RuntimeError:
+                    if not job.interrupted:
+                        raise
+                if job.interrupted:
+                    raise SpeechInterrupted(job.text)
+                job.future.set_result(True)
+            except BaseException as e:
+                job.future.set_exception(e)
+            finally:
+                with self._cv:
+                    self._current = None
+                if path and temp:
+                    try:
+                        os.remove(path)
+                    except Exception:
+                        pass
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_speech_service() -> SpeechService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SpeechService()
+        return _service
+
+
+def speak_async(text: str, priority: int = PRIO_INFO, voice: Optional[str] = None,
+                rate: Optional[str] = None, interrupt: bool = False) -> Future:
+    #Non-blocking speak(): queue the phrase on the background speech service.
+    return get_speech_service().say(text, priority=priority, voice=voice, rate=rate, interrupt=interrupt)
+
+
+def stop_speaking() -> bool:
+    #Stop whatever is playing right now (queued phrases continue).
+    return get_speech_service().stop_current()
+
+
+# ---- Templated announcements ----
+# Fixed phrases and number/time words are synthesized once (phrase cache), then joined
+# locally with short crossfades, so "Alarm set for 7:30 AM" needs no server round trip.
+ANNOUNCE_TEMPLATES = {
+    "alarm_set": "Alarm set for {time}.",
+}
+CROSSFADE_MS  = int(os.getenv("TTS_CROSSFADE_MS", "12"))
+_TRIM_LEVEL   = 300        # |sample| below this at unit edges counts as padding silence
+_EDGE_KEEP_MS = 30         # silence kept at each trimmed edge so words don't run together
+
+_ONES = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+         "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen",
+         "eighteen", "nineteen"]
+_TENS = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
+
+
+def _number_words(n: int) -> str:
+    if not 0 <= n < 100:
+        raise ValueError(f"no number unit for {n}")
+    if n < 20:
+        return _ONES[n]
+    t, o = divmod(n, 10)
+    return _TENS[t] if o == 0 else f"{_TENS[t]} {_ONES[o]}"
+
+
+def _time_units(hhmm: str):
+    #Return (units, display) for "HH:MM" 24h, e.g. (["seven", "thirty", "A M"], "7:30 AM").
+    h, m = (int(x) for x in str(hhmm).split(":", 1))
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise ValueError(f"bad time {hhmm!r}")
+    h12 = (h % 12) or 12
+    ampm = "PM" if h >= 12 else "AM"
+    units = [_number_words(h12)]
+    if 0 < m < 10:
+        units += ["oh", _number_words(m)]
+    elif m:
+        units.append(_number_words(m))
+    units.append("P M" if ampm == "PM" else "A M")
+    display = f"{h12}:{m:02d} {ampm}" if m else f"{h12} {ampm}"
+    return units, display
+
+
+def _expand_template(name: str, values: dict):
+    #Return (full_text, units) for a named template.
+    template = ANNOUNCE_TEMPLATES[name]
+    text_parts, units = [], []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        if literal:
+            text_parts.append(literal)
+            words = literal.strip(" .,!?")
+            if words:
+                units.append(words)
+        if field is None:
+            continue
+        val = values[field]
+        if field == "time":
+            u, display = _time_units(val)
+        else:
+            n = int(val)
+            u, display = [_number_words(n)], str(n)
+        units += u
+        text_parts.append(display)
+    return "".join(text_parts).strip(), units
+
+
+def template_units(names=None):
+    #Every phrase unit the templates can produce, for prefetching.
+    units = []
+    for name in (names or ANNOUNCE_TEMPLATES):
+        for literal, _, _, _ in string.Formatter().parse(ANNOUNCE_TEMPLATES[name]):
+            words = (literal or "").strip(" .,!?")
+            if words and words not in units:
+                units.append(words)
+    units += ["oh", "A M", "P M"] + [_number_words(n) for n in range(60)]
+    return units
+
+
+_PCM_CACHE = OrderedDict()     # wav path -> (sample_rate, trimmed array('h'))
+_PCM_CACHE_MAX = 128
+
+
+def _load_unit_pcm(path: str):
+    hit = _PCM_CACHE.get(path)
+    if hit is not None:
+        _PCM_CACHE.move_to_end(path)
+        return hit
+    with wave.open(path, "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError(f"unit audio must be mono 16-bit PCM: {path}")
+        rate = wf.getframerate()
+        pcm = array.array("h", wf.readframes(wf.getnframes()))
+    if sys.byteorder == "big":
+        pcm.byteswap()
+    # Trim the synthesizer's leading/trailing silence, keeping a short natural gap
+    keep = rate * _EDGE_KEEP_MS // 1000
+    start, end = 0, len(pcm)
+    while start < end and abs(pcm[start]) < _TRIM_LEVEL:
+        start += 1
+    while end > start and abs(pcm[end - 1]) < _TRIM_LEVEL:
+        end -= 1
+    pcm = pcm[max(0, start - keep):min(len(pcm), end + keep)]
+    _PCM_CACHE[path] = (rate, pcm)
+    if len(_PCM_CACHE) > _PCM_CACHE_MAX:
+        _PCM_CACHE.popitem(last=False)
+    return rate, pcm
+
+
+def join_pcm(parts, rate: int, crossfade_ms: int = CROSSFADE_MS) -> array.array:
+    #Concatenate int16 buffers, linearly crossfading `crossfade_ms` at each seam.
+    out = array.array("h")
+    xf = rate * crossfade_ms // 1000
+    for pcm in parts:
+        n = min(xf, len(out), len(pcm))
+        if n:
+            base = len(out) - n
+            for i in range(n):
+                w = (i + 1) / (n + 1)
+                out[base + i] = int(out[base + i] * (1.0 - w) + pcm[i] * w)
+        out.extend(pcm[n:])
+    return out
+
+
+def _write_wav(path: str, rate: int, pcm: array.array):
+    data = pcm
+    if sys.byteorder == "big":
+        data = array.array("h", pcm)
+        data.byteswap()
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(data.tobytes())
+
+
+def render_units(units, voice: Optional[str] = None, rate: Optional[str] = None):
+    #Return (sample_rate, array('h')) for the joined phrase units.
+    voice = (voice or DEFAULT_VOICE).strip()
+    rate  = (rate or DEFAULT_RATE).strip()
+    if _cache is None:
+        raise RuntimeError("phrase cache disabled")
+    parts, sr = [], None
+    for u in units:
+        r, pcm = _load_unit_pcm(_cache.fetch(u, voice, rate, PRIO_COMMAND))
+        if sr is not None and r != sr:
+            raise ValueError("unit sample rates differ")
+        sr = r
+        parts.append(pcm)
+    return sr, join_pcm(parts, sr)
+
+
+def announce(template: str, priority: int = PRIO_COMMAND, interrupt: bool = False,
+             voice: Optional[str] = None, rate: Optional[str] = None, **values) -> Future:
+    """Speak a templated announcement, e.g. announce("alarm_set", time="07:30").
+
+    Uses cached phrase units joined locally; falls back to full synthesis of the text.
+    """
+    text, units = _expand_template(template, values)
+    return get_speech_service().say(text, priority=priority, voice=voice, rate=rate,
+                                    interrupt=interrupt, units=units)
+
+
 # Simple CLI test: `python3 -m Plapp.tts "Hello from the Pi"`
 if __name__ == "__main__":
     txt = "Hello from the Pi."
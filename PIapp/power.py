@@ -0,0 +1,151 @@
+"""Display power management: full face by day, minimal or blank face at night / when idle.
+
+PowerManager only decides which state the UI should be in; the UI applies it (which face
+to draw, how often the clock job runs). The states are:
+
+    full     normal pages, clock redrawn every second
+    minimal  a dim HH:MM on black, redrawn once a minute
+    blank    nothing drawn; the backlight is switched off if POWER_BACKLIGHT allows it
+
+Night windows (POWER_NIGHT, e.g. "23:00-06:30", comma-separated, may wrap midnight) pick
+POWER_NIGHT_FACE. Outside them, POWER_IDLE_SEC without a touch or voice command picks
+POWER_IDLE_FACE. Any activity goes straight back to full. At night the display drops
+again after POWER_NIGHT_GRACE_SEC. Alarms are not affected: their job keeps its 1 s grid.
+"""
+
+import os
+import glob
+import time
+from typing import Callable, List, Optional, Tuple
+
+POWER_NIGHT       = os.getenv("POWER_NIGHT", "")                     # "" = no night schedule
+POWER_NIGHT_FACE  = os.getenv("POWER_NIGHT_FACE", "minimal")         # minimal | blank
+POWER_IDLE_SEC    = float(os.getenv("POWER_IDLE_SEC", "0"))          # 0 = never idle out
+POWER_IDLE_FACE   = os.getenv("POWER_IDLE_FACE", "minimal")
+NIGHT_GRACE_SEC   = float(os.getenv("POWER_NIGHT_GRACE_SEC", "30"))
+POWER_BACKLIGHT   = os.getenv("POWER_BACKLIGHT", "auto")             # auto | off | /sys/class/backlight/<dev>
+POWER_DIM_PERCENT = os.getenv("POWER_DIM_PERCENT", "")              # backlight level for the minimal face
+NIGHT_COLOR       = os.getenv("POWER_NIGHT_COLOR", "#300000")        # half of the pages' #600000
+NIGHT_FONT        = os.getenv("POWER_NIGHT_FONT", "Caviar Dreams")   # Tk falls back to its default font
+
+FULL, MINIMAL, BLANK = "full", "minimal", "blank"
+
+
+def parse_windows(spec: str) -> List[Tuple[int, int]]:
+    """"23:00-06:30,13:00-14:00" -> [(start_min, end_min), ...]; bad entries are skipped."""
+    out = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            a, b = part.split("-", 1)
+            ah, am = [int(x) for x in a.strip().split(":", 1)]
+            bh, bm = [int(x) for x in b.strip().split(":", 1)]
+            out.append((ah * 60 + am, bh * 60 + bm))
+        except ValueError:
+            print(f"Power: ignoring bad POWER_NIGHT window '{part}'")
+    return out
+
+
+def in_windows(windows: List[Tuple[int, int]], minute_of_day: int) -> bool:
+    for start, end in windows:
+        if start <= end:
+            if start <= minute_of_day < end:
+                return True
+        elif minute_of_day >= start or minute_of_day < end:     # wraps midnight
+            return True
+    return False
+
+
+def _face(name: str) -> str:
+    return name if name in (MINIMAL, BLANK) else MINIMAL
+
+
+class Backlight:
+    """Best-effort sysfs backlight control (Raspberry Pi touch display and similar)."""
+
+    def __init__(self, spec: str = POWER_BACKLIGHT):
+        self.dir = None
+        if spec == "auto":
+            found = sorted(glob.glob("/sys/class/backlight/*"))
+            self.dir = found[0] if found else None
+        elif spec and spec != "off":
+            self.dir = spec
+        self._full = None
+        self._warned = False
+
+    def _read(self, name: str) -> Optional[int]:
+        try:
+            with open(os.path.join(self.dir, name), "r") as f:
+                return int(f.read().strip())
+        except Exception:
+            return None
+
+    def _write(self, name: str, value: int):
+        try:
+            with open(os.path.join(self.dir, name), "w") as f:
+                f.write(str(value))
+        except Exception as e:
+            if not self._warned:
+                print(f"Power: backlight control unavailable ({e})")
+                self._warned = True
+
+    def apply(self, state: str):
+        if self.dir is None:
+            return
+        if self._full is None:
+            self._full = self._read("brightness")
+        if state == BLANK:
+            self._write("bl_power", 1)
+            return
+        self._write("bl_power", 0)
+        level = self._full
+        if state == MINIMAL and POWER_DIM_PERCENT:
+            top = self._read("max_brightness") or self._full or 255
+            level = max(1, int(top * float(POWER_DIM_PERCENT) / 100.0))
+        if level is not None:
+            self._write("brightness", level)
+
+
+class PowerManager:
+    def __init__(self, on_change: Callable[[str, str], None]):
+        """on_change(state, reason) is called on every transition (on the caller's thread)."""
+        self.on_change = on_change
+        self.windows = parse_windows(POWER_NIGHT)
+        self.state = FULL
+        self.last_activity = time.time()
+        self.backlight = Backlight()
+        self.transitions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.windows) or POWER_IDLE_SEC > 0
+
+    def activity(self):
+        """Touch, wake word or voice command: back to full right away."""
+        self.last_activity = time.time()
+        if self.state != FULL:
+            self._set(FULL, "activity")
+
+    def wanted(self, now: Optional[float] = None) -> Tuple[str, str]:
+        now = time.time() if now is None else now
+        idle = now - self.last_activity
+        lt = time.localtime(now)
+        if self.windows and in_windows(self.windows, lt.tm_hour * 60 + lt.tm_min) and idle >= NIGHT_GRACE_SEC:
+            return _face(POWER_NIGHT_FACE), "night"
+        if POWER_IDLE_SEC > 0 and idle >= POWER_IDLE_SEC:
+            return _face(POWER_IDLE_FACE), "idle"
+        return FULL, "day"
+
+    def evaluate(self):
+        state, reason = self.wanted()
+        if state != self.state:
+            self._set(state, reason)
+
+    def _set(self, state: str, reason: str):
+        old, self.state = self.state, state
+        self.transitions += 1
+        print(f"Power: {old} -> {state} ({reason})")
+        self.backlight.apply(state)
+        self.on_change(state, reason)
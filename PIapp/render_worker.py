@@ -0,0 +1,151 @@
+"""Off-main-thread page rendering with a Tk-safe handoff.
+
+Tk may only be touched from the thread running mainloop. TkHandoff lets any thread queue
+a callable for that thread. A byte written to a pipe wakes Tk through createfilehandler,
+or a short after() poll is used where that isn't available. RenderWorker runs the
+expensive PIL page composition on a background thread, keeping only the newest request
+per page. It hands the finished PIL image back through the handoff, so only the
+PhotoImage swap happens on the UI thread.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from .ui_bus import watch_fd
+
+_POLL_MS = 20
+
+NOT_PENDING = object()   # RenderWorker.pending(): nothing queued or rendering for the key
+ANY_SIG     = object()   # FrameCache.get(): accept whatever signature is cached
+
+
+class TkHandoff:
+    def __init__(self, root):
+        self.root = root
+        self._q = queue.Queue()
+        self._rfd = self._wfd = None
+        try:
+            self._rfd, self._wfd = os.pipe()
+            os.set_blocking(self._rfd, False)
+            os.set_blocking(self._wfd, False)
+        except Exception:
+            self._rfd = self._wfd = None
+        if self._rfd is None or not watch_fd(root, self._rfd, self._drain):
+            self._wfd = None
+            self._poll()
+
+    def post(self, fn: Callable, *args):
+        """Run fn(*args) on the Tk thread soon. Safe to call from any thread."""
+        self._q.put((fn, args))
+        if self._wfd is not None:
+            try:
+                os.write(self._wfd, b"!")
+            except BlockingIOError:
+                pass    # pipe already full of wake-ups; the drain will see this item too
+
+    def _drain(self):
+        if self._rfd is not None:
+            try:
+                while os.read(self._rfd, 4096):
+                    pass
+            except (BlockingIOError, OSError):
+                pass
+        while True:
+            try:
+                fn, args = self._q.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn(*args)
+            except Exception as e:
+                print("UI handoff callback failed:", e)
+
+    def _poll(self):
+        self._drain()
+        self.root.after(_POLL_MS, self._poll)
+
+
+class RenderWorker:
+    """One background thread producing PIL frames; newest request per key wins."""
+
+    def __init__(self, handoff: TkHandoff):
+        self.handoff = handoff
+        self._cv = threading.Condition()
+        self._pending = OrderedDict()   # key -> (sig, fn, args, on_done), run front to back
+        self._busy_key = None
+        self._busy_sig = None
+        self.stats = {"rendered": 0, "superseded": 0, "ms_total": 0.0}
+        threading.Thread(target=self._run, name="render-worker", daemon=True).start()
+
+    def submit(self, key: str, sig, fn: Callable, args: tuple, on_done: Callable, urgent: bool = True):
+        """Render fn(*args) off-thread, then call on_done(key, sig, image) on the Tk thread.
+
+        A newer submit for the same key replaces one that hasn't started yet. Urgent jobs
+        (the page on screen) go ahead of background prefetches.
+        """
+        with self._cv:
+            if self._pending.pop(key, None) is not None:
+                self.stats["superseded"] += 1
+            self._pending[key] = (sig, fn, args, on_done)
+            if urgent:
+                self._pending.move_to_end(key, last=False)
+            self._cv.notify()
+
+    def pending(self, key: str) -> object:
+        """Signature queued or being rendered for key, or NOT_PENDING."""
+        with self._cv:
+            item = self._pending.get(key)
+            if item is not None:
+                return item[0]
+            return self._busy_sig if self._busy_key == key else NOT_PENDING
+
+    def _run(self):
+        while True:
+            with self._cv:
+                while not self._pending:
+                    self._cv.wait()
+                key = next(iter(self._pending))
+                sig, fn, args, on_done = self._pending.pop(key)
+                self._busy_key, self._busy_sig = key, sig
+            t0 = time.perf_counter()
+            try:
+                image = fn(*args)
+            except Exception as e:
+                print(f"Render of '{key}' failed: {e}")
+                image = None
+            self.stats["rendered"] += 1
+            self.stats["ms_total"] += (time.perf_counter() - t0) * 1000
+            if image is not None:
+                self.handoff.post(on_done, key, sig, image)
+            with self._cv:
+                self._busy_key = self._busy_sig = None
+
+
+class FrameCache:
+    """Small LRU of finished page frames: key -> {"sig", "photo", "image"}.
+
+    Holds the current page and its neighbours so a swipe can show them immediately.
+    The PIL image is kept alongside the PhotoImage for compositing.
+    """
+
+    def __init__(self, max_items: int = 4):
+        self.max_items = max_items
+        self._items = OrderedDict()
+
+    def get(self, key: str, sig=ANY_SIG):
+        """Entry for key (any signature if sig is ANY_SIG), refreshing its LRU position."""
+        entry = self._items.get(key)
+        if entry is None or (sig is not ANY_SIG and entry["sig"] != sig):
+            return None
+        self._items.move_to_end(key)
+        return entry
+
+    def put(self, key: str, sig, photo, image):
+        self._items[key] = {"sig": sig, "photo": photo, "image": image}
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
@@ -0,0 +1,144 @@
+"""Wall-clock-aligned periodic jobs on the Tk event loop.
+
+`root.after(1000, tick)` after the work makes every period 1 s + work time, so the
+seconds display drifts and now and then skips a second. Here each job has a due time
+on a fixed grid (e.g. every whole second + 5 ms), and the loop keeps one Tk timer armed
+for the earliest due job. Lateness is measured on every run. When a job falls behind
+(a long render or a blocked loop), the missed runs are coalesced into one and counted,
+instead of being replayed back to back.
+"""
+
+import os
+import math
+import time
+from typing import Callable, Dict
+
+LATE_WARN_MS = float(os.getenv("SCHED_LATE_WARN_MS", "250"))
+
+
+class Job:
+    def __init__(self, name: str, period: float, fn: Callable[[], None], align: bool, offset: float):
+        self.name = name
+        self.period = period
+        self.fn = fn
+        self.align = align
+        self.offset = offset
+        self.next_t = 0.0
+        self.enabled = True
+        self.runs = 0
+        self.skipped = 0
+        self.late_max = 0.0
+        self.late_sum = 0.0
+        self.cost_sum = 0.0
+
+    def schedule_after(self, now: float):
+        """Next due time strictly after `now` on this job's grid."""
+        if self.align:
+            self.next_t = (math.floor((now - self.offset) / self.period) + 1) * self.period + self.offset
+        else:
+            self.next_t = now + self.period
+
+
+class Scheduler:
+    def __init__(self, root):
+        self.root = root
+        self.jobs: Dict[str, Job] = {}
+        self._after_id = None
+        self._running = False
+
+    def every(self, name: str, period: float, fn: Callable[[], None],
+              align: bool = False, offset: float = 0.0, run_now: bool = False) -> Job:
+        """Run fn every `period` s. align=True pins runs to wall-clock multiples of period (+offset)."""
+        job = Job(name, period, fn, align, offset)
+        now = time.time()
+        if run_now:
+            job.next_t = now
+        else:
+            job.schedule_after(now)
+        self.jobs[name] = job
+        if self._running:
+            self._arm()
+        return job
+
+    def set_period(self, name: str, period: float):
+        job = self.jobs[name]
+        job.period = period
+        job.schedule_after(time.time())
+        if self._running:
+            self._arm()
+
+    def run_soon(self, name: str):
+        """Make a job due immediately (e.g. after a state change it should react to)."""
+        self.jobs[name].next_t = time.time()
+        if self._running:
+            self._arm()
+
+    def start(self):
+        self._running = True
+        self._arm()
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def stats(self) -> dict:
+        return {
+            j.name: {
+                "runs": j.runs,
+                "skipped": j.skipped,
+                "late_avg_ms": round(1000 * j.late_sum / max(1, j.runs), 1),
+                "late_max_ms": round(1000 * j.late_max, 1),
+                "cost_avg_ms": round(1000 * j.cost_sum / max(1, j.runs), 2),
+            } for j in self.jobs.values()
+        }
+
+    # ---- internals ----
+    def _arm(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        live = [j for j in self.jobs.values() if j.enabled]
+        if not live:
+            return
+        now = time.time()
+        for j in live:
+            # Wall clock stepped backwards (NTP): don't wait out the gap
+            if j.next_t - now > j.period + 1.0:
+                j.schedule_after(now)
+        due = min(j.next_t for j in live)
+        delay_ms = max(0, int(math.ceil((due - now) * 1000)))
+        self._after_id = self.root.after(delay_ms, self._fire)
+
+    def _fire(self):
+        self._after_id = None
+        now = time.time()
+        for job in sorted(self.jobs.values(), key=lambda j: j.next_t):
+            if not job.enabled or job.next_t > now + 0.002:
+                continue
+            late = now - job.next_t
+            missed = int(late // job.period) if job.period > 0 else 0
+            job.runs += 1
+            job.skipped += missed
+            job.late_sum += late
+            job.late_max = max(job.late_max, late)
+            if late * 1000 > LATE_WARN_MS:
+                print(f"Scheduler: '{job.name}' ran {late * 1000:.0f} ms late"
+                      + (f", coalesced {missed} missed run(s)" if missed else ""))
+            t0 = time.perf_counter()
+            try:
+                job.fn()
+            except Exception as e:
+                print(f"Scheduler: job '{job.name}' failed: {e}")
+            job.cost_sum += time.perf_counter() - t0
+            # Aligned jobs stay on their grid; if the work overran the next slot it runs (late) right away
+            job.schedule_after(now if job.align else time.time())
+        if self._running:
+            self._arm()
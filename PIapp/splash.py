@@ -0,0 +1,118 @@
+"""Boot splash: the last rendered frame, shown before anything heavy is imported.
+
+While running, the UI periodically saves the page on screen as a palette PNG, along with
+a small JSON state file holding the view and the last weather payload. Both go in
+SPLASH_DIR. On the next start the PNG is loaded with Tk's built-in PNG reader (no
+Pillow needed) right after the window is created. The live page replaces it once
+rendering is up. Files are written to a temp name, fsync'd and renamed, so a power cut
+leaves the previous splash intact instead of a torn one.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Optional
+
+SPLASH_DIR      = os.getenv("UI_SPLASH_DIR", os.path.join(os.path.dirname(__file__), "tmp"))
+SPLASH_ENABLED  = os.getenv("UI_SPLASH", "1") == "1"
+SAVE_EVERY_SEC  = float(os.getenv("UI_SPLASH_SAVE_SEC", "120"))   # SD-card friendly; view changes save sooner
+SPLASH_COLORS   = int(os.getenv("UI_SPLASH_COLORS", "64"))
+
+FRAME_PATH = os.path.join(SPLASH_DIR, "last_frame.png")
+STATE_PATH = os.path.join(SPLASH_DIR, "last_state.json")
+
+
+def _atomic_write(path: str, data: bytes):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_state() -> dict:
+    """{"view", "ts", "weather", "weather_ts"} from the last run, or {} if there is none.
+
+    ts is when the splash was saved; weather_ts is when the weather payload was fetched.
+    """
+    if not SPLASH_ENABLED:
+        return {}
+    try:
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except Exception:
+        return {}
+
+
+def load_photo(master):
+    """tk.PhotoImage of the last frame, or None. Uses Tk's PNG reader, so Pillow isn't imported."""
+    if not SPLASH_ENABLED or not os.path.exists(FRAME_PATH):
+        return None
+    try:
+        import tkinter as tk
+        return tk.PhotoImage(master=master, file=FRAME_PATH)
+    except Exception as e:
+        print("Splash frame unreadable:", e)
+        return None
+
+
+class SplashWriter:
+    """Saves (frame, view, weather) in the background; at most one write in flight, newest wins."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next = None
+        self._busy = False
+        self._last_save = 0.0
+        self._last_view = None
+
+    def due(self, view: str) -> bool:
+        return SPLASH_ENABLED and (view != self._last_view or time.time() - self._last_save >= SAVE_EVERY_SEC)
+
+    def save(self, image, view: str, weather: Optional[dict] = None, weather_ts: float = 0.0,
+             block: bool = False):
+        """Queue a save (or write now with block=True, e.g. on exit).
+
+        `image` must be a PIL image the caller no longer mutates.
+        """
+        if not SPLASH_ENABLED or image is None:
+            return
+        self._last_save = time.time()
+        self._last_view = view
+        if block:
+            self._write(image, view, weather, weather_ts)
+            return
+        with self._lock:
+            self._next = (image, view, weather, weather_ts)
+            if self._busy:
+                return
+            self._busy = True
+        threading.Thread(target=self._run, name="splash-writer", daemon=True).start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                job, self._next = self._next, None
+                if job is None:
+                    self._busy = False
+                    return
+            self._write(*job)
+
+    def _write(self, image, view, weather, weather_ts):
+        import io
+        try:
+            t0 = time.perf_counter()
+            os.makedirs(SPLASH_DIR, exist_ok=True)
+            buf = io.BytesIO()
+            # A palette PNG of these flat-colour pages is a few tens of KB and decodes fast in Tk
+            image.convert("RGB").quantize(colors=SPLASH_COLORS).save(buf, format="PNG")
+            _atomic_write(FRAME_PATH, buf.getvalue())
+            state = {"view": view, "ts": round(time.time(), 1), "weather": weather,
+                     "weather_ts": round(weather_ts, 1) if weather is not None else 0.0}
+            _atomic_write(STATE_PATH, json.dumps(state, ensure_ascii=False).encode("utf-8"))
+            print(f"Splash saved ({view}, {len(buf.getvalue()) // 1024} KB, {(time.perf_counter() - t0) * 1000:.0f} ms)")
+        except Exception as e:
+            print("Splash save failed:", e)
@@ -0,0 +1,107 @@
+"""Voice -> UI wake-up channel over a Unix datagram socket.
+
+The UI binds VOICE_CMD_SOCK and registers it with Tk's file-handler mechanism, so a
+command is applied as soon as it is posted instead of on the next poll. Commands
+themselves go through the ordered journal (cmd_journal.post); the datagram is only a
+poke.
+"""
+
+import os
+import json
+import socket
+import tempfile
+from typing import Callable, List, Optional
+
+VOICE_CMD_SOCK = os.getenv("VOICE_CMD_SOCK", os.path.join(tempfile.gettempdir(), "cc_voice_cmd.sock"))
+_HAVE_UNIX = hasattr(socket, "AF_UNIX")
+
+
+def poke(path: str = VOICE_CMD_SOCK) -> bool:
+    """Tell the UI there is something new in the journal (best effort)."""
+    if not _HAVE_UNIX:
+        return False
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        s.sendto(b"!", path)
+        return True
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+class CommandInbox:
+    """UI side of the bus: a bound, non-blocking datagram socket."""
+
+    def __init__(self, path: str = VOICE_CMD_SOCK):
+        self.path = path
+        self.sock = None
+        if not _HAVE_UNIX:
+            return
+        try:
+            os.unlink(path)     # stale socket from a previous run
+        except OSError:
+            pass
+        try:
+            s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            s.bind(path)
+            s.setblocking(False)
+            self.sock = s
+        except OSError as e:
+            print(f"UI bus unavailable ({e}); commands will be picked up by polling")
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def drain(self) -> List[dict]:
+        """All commands queued on the socket right now, in arrival order (pokes are skipped)."""
+        out = []
+        while self.sock is not None:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break
+            if data == b"!":
+                continue
+            try:
+                msg = json.loads(data.decode("utf-8"))
+            except Exception:
+                continue
+            out.extend(m for m in (msg if isinstance(msg, list) else [msg]) if isinstance(m, dict))
+        return out
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+def watch_fd(root, fileobj, callback: Callable[[], None]) -> bool:
+    """Call callback() on the Tk thread whenever fileobj is readable.
+
+    Uses Tk's createfilehandler (Unix only). Returns False when unsupported so the caller
+    can poll instead.
+    """
+    try:
+        import tkinter
+        root.tk.createfilehandler(fileobj, tkinter.READABLE, lambda *_: callback())
+        return True
+    except Exception:
+        return False
+
+
+def open_inbox(root, on_commands: Callable[[List[dict]], None]) -> Optional[CommandInbox]:
+    """Bind the inbox and hook it into root's event loop; None if event-driven delivery isn't possible."""
+    inbox = CommandInbox()
+    if inbox.sock is None:
+        return None
+    if not watch_fd(root, inbox.sock, lambda: on_commands(inbox.drain())):
+        inbox.close()
+        return None
+    return inbox
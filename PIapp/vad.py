@@ -0,0 +1,103 @@
+"""Energy / zero-crossing voice-activity endpointing for command recordings.
+
+Instead of always recording VOICE_SEC seconds, record_utterance() feeds frames to an
+Endpointer and stops once the speaker has been quiet for a trailing-silence window.
+"""
+
+import os
+
+VAD_ENABLED       = os.getenv("VOICE_VAD", "1") == "1"
+VAD_SILENCE_MS    = int(os.getenv("VOICE_VAD_SILENCE_MS", "700"))    # trailing silence that ends a command
+VAD_MIN_MS        = int(os.getenv("VOICE_VAD_MIN_MS", "600"))        # never stop before this much audio
+VAD_START_MS      = int(os.getenv("VOICE_VAD_START_MS", "4000"))     # give up if no speech starts by then
+VAD_RATIO         = float(os.getenv("VOICE_VAD_RATIO", "3.0"))       # speech = energy this far above noise
+VAD_MIN_RMS       = float(os.getenv("VOICE_VAD_MIN_RMS", "250"))     # absolute floor for the speech threshold
+_ZCR_FRICATIVE    = 0.25   # quieter frames with this many zero crossings still count (s, f, sh)
+_STEP             = 2      # analyse every 2nd sample; plenty for 16 kHz speech energy
+
+
+def frame_features(frame):
+    """Return (rms, zero_crossing_rate) for an int16 frame."""
+    sq = 0
+    zc = 0
+    prev = 0
+    n = 0
+    for s in frame[::_STEP]:
+        sq += s * s
+        if (s < 0) != (prev < 0):
+            zc += 1
+        prev = s
+        n += 1
+    if not n:
+        return 0.0, 0.0
+    return (sq / n) ** 0.5, zc / float(n)
+
+
+class Endpointer:
+    """Decides when a command utterance has ended.
+
+    push() one frame at a time; it returns True once recording should stop. `reason` is
+    "silence", "max" or "no_speech" afterwards.
+    """
+
+    def __init__(self, frame_sec: float, max_sec: float, silence_ms: int = VAD_SILENCE_MS,
+                 min_ms: int = VAD_MIN_MS, start_ms: int = VAD_START_MS):
+        self.frame_sec = frame_sec
+        self.max_frames = max(1, int(max_sec / frame_sec))
+        self.silence_frames = max(1, int(silence_ms / 1000.0 / frame_sec))
+        self.min_frames = int(min_ms / 1000.0 / frame_sec)
+        self.start_frames = int(start_ms / 1000.0 / frame_sec)
+        self.noise = None
+        self.frames = 0
+        self.speech_frames = 0
+        self.first_speech = None
+        self.last_speech = None
+        self.reason = None
+
+    def prime(self, frames):
+        """Seed the noise floor from audio known to precede the command (quietest 30%)."""
+        levels = sorted(frame_features(f)[0] for f in frames if f is not None)
+        if levels:
+            self.noise = levels[int(len(levels) * 0.3)]
+
+    def _is_speech(self, rms: float, zcr: float) -> bool:
+        floor = self.noise if self.noise is not None else VAD_MIN_RMS / VAD_RATIO
+        hi = max(VAD_MIN_RMS, floor * VAD_RATIO)
+        lo = max(VAD_MIN_RMS * 0.6, floor * VAD_RATIO * 0.6)
+        return rms > hi or (rms > lo and zcr > _ZCR_FRICATIVE)
+
+    def push(self, frame) -> bool:
+        rms, zcr = frame_features(frame)
+        idx = self.frames
+        self.frames += 1
+        if self._is_speech(rms, zcr):
+            self.speech_frames += 1
+            if self.first_speech is None:
+                self.first_speech = idx
+            self.last_speech = idx
+        else:
+            # Track slow changes in background noise between words
+            self.noise = rms if self.noise is None else 0.95 * self.noise + 0.05 * rms
+
+        if self.frames >= self.max_frames:
+            self.reason = "max"
+        elif self.first_speech is None:
+            if self.frames >= self.start_frames:
+                self.reason = "no_speech"
+        elif (self.frames >= self.min_frames
+              and idx - self.last_speech >= self.silence_frames):
+            self.reason = "silence"
+        return self.reason is not None
+
+    @property
+    def trailing_silence_frames(self) -> int:
+        if self.last_speech is None:
+            return 0
+        return self.frames - 1 - self.last_speech
+
+    def stats(self) -> dict:
+        return {
+            "duration_s": round(self.frames * self.frame_sec, 2),
+            "speech_s": round(self.speech_frames * self.frame_sec, 2),
+            "reason": self.reason,
+        }
@@ -4,6 +4,10 @@ import signal
 import subprocess
 import requests
 import json
+import re
+import tempfile
+import queue
+import threading
 from datetime import datetime
 from typing import Optional
 
@@ -11,6 +15,11 @@ from typing import Optional
 import pvporcupine
 from pvrecorder import PvRecorder
 from . import BACKEND_URL
+from .audio_capture import ArecordSource, CaptureStream, PvRecorderSource, write_wav
+from .vad import VAD_ENABLED, Endpointer, frame_features
+from .bargein import EchoGate
+from .cmd_journal import post as journal_post
+from .audio_codec import encode_for_upload, remember_server_formats
 # Load local .env when running module directly
 try:
     from pathlib import Path
@@ -42,14 +51,26 @@ KEYWORD      = [
 
 
 SENSITIVITY  = float(os.getenv("PORCUPINE_SENSITIVITY", "0.65"))  # 0.1..0.9 (higher = more sensitive)
-RECORD_SEC   = int(os.getenv("VOICE_SEC", "10"))  # seconds to record after wake word
+RECORD_SEC   = int(os.getenv("VOICE_SEC", "10"))  # max seconds to record after wake word (VAD usually stops earlier)
+PIPELINE_DEPTH = int(os.getenv("VOICE_PIPELINE_DEPTH", "2"))  # recorded commands waiting for the server
 COOLDOWN_SEC = 1.5             # ignore new triggers for this long after each detection
+PREROLL_MS   = int(os.getenv("VOICE_PREROLL_MS", "250"))  # audio kept from before the wake-word detection
 SAVE_DIR     = "/tmp"          # where temp wav files are stored
+# One round trip: /converse returns the transcription JSON plus the spoken confirmation audio
+CONVERSE     = os.getenv("VOICE_CONVERSE", "0") == "1"
+CONVERSE_EP  = os.getenv("VOICE_CONVERSE_URL", TRANSCRIBE_EP.rsplit("/", 1)[0] + "/converse")
+HEALTH_EP    = os.getenv("VOICE_HEALTH_URL", TRANSCRIBE_EP.rsplit("/", 1)[0] + "/health")
 # Voice command file path for UI IPC
 VOICE_CMD_PATH = os.getenv("VOICE_CMD_PATH", "/tmp/cc_voice_cmd.json")
 # Offline mode (no Flask). If set to "1", skip sending to server and optionally play back.
 OFFLINE_ONLY = os.getenv("VOICE_OFFLINE", "0") == "1"
 PLAYBACK_AFTER_RECORD = os.getenv("VOICE_PLAYBACK", "0") == "1"
+# On-device fallback recognizer (faster-whisper, CPU int8): auto = when the server is down/slow
+LOCAL_ASR         = os.getenv("VOICE_LOCAL_ASR", "auto").strip().lower()   # auto|always|off
+LOCAL_ASR_MODEL   = os.getenv("VOICE_LOCAL_ASR_MODEL", "tiny.en")
+LOCAL_ASR_THREADS = int(os.getenv("VOICE_LOCAL_ASR_THREADS", "2"))          # leave cores for the UI
+SERVER_BUDGET_MS  = int(os.getenv("VOICE_SERVER_BUDGET_MS", "800"))         # /health slower than this = fall back
+HEALTH_TTL_SEC    = float(os.getenv("VOICE_HEALTH_TTL", "15"))
 
 STOP = False
 
@@ -127,19 +148,233 @@ def handle_signal(sig, frame):
     STOP = True
     print("\nStopping...")
 
-def record_wav(path: str):
-    """Record audio with arecord to the given path (16kHz, 2ch, 16-bit)."""
-    subprocess.run([
-        "arecord",
-        "-D", ARECORD_CARD,
-        "-f", "S16_LE",
-        "-r", "16000",
-        "-c", "1",
-        "-d", str(RECORD_SEC),
-        path
-    ], check=True)
+def record_utterance(capture, cursor, path: str, start_seq: int, onset_seq: Optional[int] = None) -> float:
+    """Write the command that follows the wake word, from the capture ring, to a WAV file.
+
+    The WAV starts at start_seq (pre-roll included). With VOICE_VAD=1 (default) recording
+    ends after VOICE_VAD_SILENCE_MS of trailing silence (bounded by VOICE_VAD_MIN_MS and
+    VOICE_SEC); otherwise exactly VOICE_SEC is kept. Only frames from onset_seq (the first
+    frame after the detection) are fed to the endpointer: the pre-roll holds the tail of the
+    wake word, which must not count as the command starting.
+    Returns the recorded duration in seconds.
+    """
+    ring = capture.ring
+    max_frames = int(RECORD_SEC / capture.frame_sec)
+    end_seq = start_seq + max_frames
+    if onset_seq is None:
+        onset_seq = start_seq
+    ep = None
+    if VAD_ENABLED:
+        ep = Endpointer(capture.frame_sec, RECORD_SEC)
+        # Noise floor from the second before the wake word was spoken
+        back = int(1.0 / capture.frame_sec)
+        ep.prime([ring.frame(q) for q in range(start_seq - 2 * back, start_seq - back)])
+        for q in range(onset_seq, cursor.seq):   # post-detection audio already in the ring
+            frame = ring.frame(q)
+            if frame is not None and ep.push(frame):
+                break
+    t0 = time.time()
+    while cursor.seq < end_seq and not STOP and not (ep and ep.reason):
+        seq, frame = cursor.next(timeout=1.0)
+        if seq is None:
+            raise subprocess.CalledProcessError(1, "capture", "microphone stream stalled")
+        if ep and seq >= onset_seq and frame is not None and ep.push(frame):
+            break
+    stop_seq = min(end_seq, cursor.seq)
+    if ep and ep.reason == "silence":
+        # Keep a little of the trailing silence so the last word isn't clipped
+        keep = int(0.2 / capture.frame_sec)
+        stop_seq -= max(0, ep.trailing_silence_frames - keep)
+    pcm = ring.pcm_bytes(start_seq, stop_seq)
+    write_wav(path, pcm, capture.rate)
+    dur = len(pcm) / 2.0 / capture.rate
+    if ep:
+        st = ep.stats()
+        print(f"[voice] utterance {dur:.2f}s (speech {st['speech_s']:.2f}s, ended by {st['reason']}, "
+              f"{time.time() - t0:.2f}s after wake)")
+    return dur
+
+def _write_ui_payload(nlu: dict, spoken: bool = False):
+    payload = {"nlu": nlu}
+    if spoken:
+        payload["spoken"] = True  # confirmation already played here; UI should not announce again
+    intent = (nlu.get("intent") or "").lower()
+    if intent == "goto" and nlu.get("view"):
+        payload.update({"cmd": "goto", "view": nlu["view"]})
+    elif intent == "set_alarm" and nlu.get("alarm_time"):
+        payload.update({"cmd": "set_alarm", "time": nlu["alarm_time"]})
+    elif intent == "plan_commute":
+        # The server has already told the user "Alarm set for ..."; make it so
+        prop = nlu.get("alarm_proposal") or {}
+        if isinstance(prop, dict) and prop.get("alarm_time"):
+            payload.update({"cmd": "set_alarm", "time": prop["alarm_time"]})
+
+    if journal_post(payload):
+        print("[voice] posted UI payload:", payload)
+        return
+    try:
+        with open(VOICE_CMD_PATH, "w", encoding="utf-8") as g:
+            json.dump(payload, g, ensure_ascii=False)
+        print("[voice] wrote UI payload:", payload)
+    except Exception as e:
+        print("[voice] could not write VOICE_CMD_PATH:", e)
+
+
+def _iter_multipart(resp):
+    """Yield (content_type, body) for each part of a streamed multipart response as it arrives."""
+    m = re.search(r'boundary="?([^";]+)"?', resp.headers.get("Content-Type", ""))
+    if not m:
+        raise ValueError("response is not multipart")
+    delim = b"--" + m.group(1).encode("ascii")
+    buf = b""
+    chunks = resp.iter_content(chunk_size=16 * 1024)
+    while True:
+        i = buf.find(delim)
+        if i >= 0:
+            rest = buf[i + len(delim):]
+            if rest[:2] == b"--":
+                return
+            h = rest.find(b"\r\n\r\n")
+            if h >= 0:
+                headers = {}
+                for line in rest[:h].decode("latin-1").split("\r\n"):
+                    if ":" in line:
+                        k, v = line.split(":", 1)
+                        headers[k.strip().lower()] = v.strip()
+                body_start = h + 4
+                n = int(headers.get("content-length", "-1"))
+                end = body_start + n if n >= 0 else rest.find(b"\r\n" + delim, body_start)
+                if (n >= 0 and len(rest) >= end) or (n < 0 and end >= 0):
+                    yield headers.get("content-type", ""), rest[body_start:end]
+                    buf = rest[end:]
+                    continue
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        buf += chunk
+
+
+def _post_audio(url: str, path: str, **kwargs):
+    """POST the recording, compressed if the server accepts it; logs size saved and timings."""
+    up_path, fmt, mime, st = encode_for_upload(path, HEALTH_EP)
+    t0 = time.perf_counter()
+    try:
+        with open(up_path, "rb") as f:
+            # Short connect timeout: a dead server should fail fast, not after 30 s
+            resp = requests.post(url, files={"audio": (os.path.basename(up_path), f, mime)},
+                                 timeout=(3, 30), **kwargs)
+    finally:
+        if up_path != path:
+            try:
+                os.remove(up_path)
+            except Exception:
+                pass
+    saved = st["wav_bytes"] - st["bytes"]
+    print(f"[voice] uploaded {fmt}: {st['bytes']} bytes (saved {saved}, "
+          f"{100.0 * saved / max(1, st['wav_bytes']):.0f}%), encode {st['encode_ms']:.0f} ms, "
+          f"upload+response {(time.perf_counter() - t0) * 1000:.0f} ms")
+    return resp
+
+
+def _converse(path: str) -> str:
+    """POST to /converse: apply the command as soon as the JSON part arrives, then play the reply."""
+    resp = _post_audio(CONVERSE_EP, path, stream=True)
+    with resp:
+        resp.raise_for_status()
+        if not resp.headers.get("Content-Type", "").startswith("multipart/"):
+            data = resp.json()
+            raise requests.RequestException(data.get("error") or "unexpected /converse response")
+        text = ""
+        for ctype, body in _iter_multipart(resp):
+            if ctype.startswith("application/json"):
+                data = json.loads(body.decode("utf-8"))
+                text = (data.get("text") or "").strip()
+                _write_ui_payload(data.get("nlu") or {"intent": "none"}, spoken=bool(data.get("say")))
+            elif ctype.startswith("audio/"):
+                from .pi_tts import play_file
+                fd, wav = tempfile.mkstemp(suffix=".wav")
+                try:
+                    with os.fdopen(fd, "wb") as w:
+                        w.write(body)
+                    play_file(wav)
+                except Exception as e:
+                    print(f"[voice] could not play reply: {e}")
+                finally:
+                    try:
+                        os.remove(wav)
+                    except Exception:
+                        pass
+        return text
+
+
+_health = {"ok": None, "checked": 0.0}
+_local_model = None
+_local_lock = threading.Lock()
+
+
+def _server_ok() -> bool:
+    """Is the PC server up and answering /health within SERVER_BUDGET_MS? Cached for HEALTH_TTL_SEC."""
+    now = time.time()
+    if _health["ok"] is not None and now - _health["checked"] < HEALTH_TTL_SEC:
+        return _health["ok"]
+    t0 = time.perf_counter()
+    try:
+        r = requests.get(HEALTH_EP, timeout=SERVER_BUDGET_MS / 1000.0)
+        r.raise_for_status()
+        remember_server_formats(HEALTH_EP, r.json())
+        ms = (time.perf_counter() - t0) * 1000
+        ok = ms <= SERVER_BUDGET_MS
+        if not ok:
+            print(f"[voice] server health took {ms:.0f} ms (budget {SERVER_BUDGET_MS} ms)")
+    except Exception as e:
+        print(f"[voice] server unavailable: {e}")
+        ok = False
+    _health.update(ok=ok, checked=now)
+    return ok
+
+
+def _get_local_model():
+    global _local_model
+    with _local_lock:
+        if _local_model is None:
+            from faster_whisper import WhisperModel
+            t0 = time.perf_counter()
+            _local_model = WhisperModel(LOCAL_ASR_MODEL, device="cpu", compute_type="int8",
+                                        cpu_threads=LOCAL_ASR_THREADS, num_workers=1)
+            print(f"[voice] loaded local ASR {LOCAL_ASR_MODEL} in {time.perf_counter() - t0:.1f}s")
+        return _local_model
+
+
+def _recognize_locally(path: str) -> Optional[str]:
+    """Transcribe on the Pi and apply the command via the local intent matcher; None if unavailable."""
+    try:
+        model = _get_local_model()
+    except Exception as e:
+        print(f"[voice] local ASR unavailable ({type(e).__name__}: {e}); pip install faster-whisper")
+        return None
+    t0 = time.perf_counter()
+    try:
+        with _local_lock:
+            segments, _ = model.transcribe(path, language="en", beam_size=1, without_timestamps=True,
+                                           condition_on_previous_text=False)
+            text = "".join(s.text for s in segments).strip()   # segments decode lazily
+    except Exception as e:
+        print(f"[voice] local ASR failed ({type(e).__name__}: {e})")
+        return None
+    print(f"[voice] local ASR {(time.perf_counter() - t0) * 1000:.0f} ms: {text!r}")
+    _write_ui_payload(_local_regex_nlu(text))
+    return text
+
 
 def send_to_server(path: str) -> str:
+    """Recognize a command: PC server when healthy, else the on-device fallback (if enabled)."""
+    use_local = LOCAL_ASR == "always" or (OFFLINE_ONLY and LOCAL_ASR != "off")
+    if not use_local and not OFFLINE_ONLY and LOCAL_ASR == "auto":
+        use_local = not _server_ok()
+    if use_local:
+        text = _recognize_locally(path)
+        if text is not None:
+            return text
     if OFFLINE_ONLY:
         try:
             size = os.path.getsize(path)
@@ -148,31 +383,21 @@ def send_to_server(path: str) -> str:
         print(f"[voice] OFFLINE: saved at {path} (size={size}). Skipping server.")
         return ""
     try:
-        with open(path, "rb") as f:
-            resp = requests.post(TRANSCRIBE_EP, files={"audio": f}, timeout=30)
+        if CONVERSE:
+            return _converse(path)
+        resp = _post_audio(TRANSCRIBE_EP, path)
         resp.raise_for_status()
         data = resp.json()
         text = (data.get("text") or "").strip()
         nlu  = data.get("nlu") or {"intent": "none"}
-
-        payload = {"nlu": nlu}
-        intent = (nlu.get("intent") or "").lower()
-        if intent == "goto" and nlu.get("view"):
-            payload.update({"cmd": "goto", "view": nlu["view"]})
-        elif intent == "set_alarm" and nlu.get("alarm_time"):
-            payload.update({"cmd": "set_alarm", "time": nlu["alarm_time"]})
-
-        try:
-            with open(VOICE_CMD_PATH, "w", encoding="utf-8") as g:
-                json.dump(payload, g, ensure_ascii=False)
-            print("[voice] wrote UI payload:", payload)
-        except Exception as e:
-            print("[voice] could not write VOICE_CMD_PATH:", e)
-
+        _write_ui_payload(nlu)
         return text
 
     except requests.RequestException as e:
         print(f"[voice] HTTP error posting audio: {e}")
+        _health.update(ok=False, checked=time.time())
+        if LOCAL_ASR == "auto" and not use_local:
+            return _recognize_locally(path) or ""
         return ""
     except Exception as e:
         print(f"[voice] Unexpected error posting audio: {e}")
@@ -182,6 +407,8 @@ def send_to_server(path: str) -> str:
 def _emit_ui_command(view: str, heard_text: str = ""):
     try:
         payload = {"cmd": "goto", "view": view, "text": heard_text}
+        if journal_post(payload):
+            return
         with open(VOICE_CMD_PATH, "w", encoding="utf-8") as f:
             json.dump(payload, f, ensure_ascii=False)
     except Exception:
@@ -194,14 +421,20 @@ def _to_24h(h, m, ap):
         if ap == "am" and h == 12: h = 0
     return f"{h:02d}:{(m or 0):02d}"
 
+_RE_SET_ALARM = re.compile(
+    r"\b(?:set|wake me)\b.*?\b(\d{1,2})(?:[:.\s](\d{2}))?\s*([ap])?\.?\s*(?:m\b\.?)?", re.I)
+_RE_GOTO = re.compile(
+    r"\b(?:show|open|go to|switch to|display)?\s*(?:me\s+)?(?:the\s+)?(clock|weather|calendar|alarms?)\b", re.I)
+
 def _local_regex_nlu(text: str):
     if not text: return {"intent":"none"}
-    m = _RE_GOTO.search(text)
-    if m: return {"intent":"goto","view":m.group(1).lower()}
+    # Alarm first: "set an alarm for 7" must not become "goto alarm"
     m = _RE_SET_ALARM.search(text)
-    if m:
-        h = int(m.group(1)); mm = int(m.group(2) or 0); ap = m.group(3)
+    if m and int(m.group(1)) < 24 and int(m.group(2) or 0) < 60:
+        h = int(m.group(1)); mm = int(m.group(2) or 0); ap = (m.group(3) + "m") if m.group(3) else None
         return {"intent":"set_alarm","alarm_time":_to_24h(h, mm, ap)}
+    m = _RE_GOTO.search(text)
+    if m: return {"intent":"goto","view":m.group(1).lower().rstrip("s")}
     return {"intent":"none"}
 
 def get_intent(text: str):
@@ -215,6 +448,84 @@ def get_intent(text: str):
         pass
     return _local_regex_nlu(text)
 
+def _map_simple(txt: str):
+    """Map recognized text to a UI view by keyword (English / Japanese)."""
+    t = (txt or "").strip().lower()
+    if not t:
+        return None
+    pairs = [
+        ("clock", ("clock", "\u6642\u8a08", "\u30af\u30ed\u30c3\u30af")),
+        ("weather", ("weather", "\u5929\u6c17")),
+        ("calendar", ("calendar", "\u30ab\u30ec\u30f3\u30c0\u30fc")),
+        ("alarm", ("alarm", "\u30a2\u30e9\u30fc\u30e0")),
+        ("voice", ("voice", "\u30dc\u30a4\u30b9", "\u9332\u97f3")),
+    ]
+    for v, keys in pairs:
+        for k in keys:
+            if k in t:
+                return v
+    return None
+
+def _feedback(q, text: str, hold: Optional[float] = None):
+    """Queue a popup message; hold=None keeps it up until the next one, else hide after `hold` s."""
+    try:
+        q.put_nowait((text, hold))
+    except queue.Full:
+        pass    # feedback is best effort; never stall the capture loop on it
+
+def _upload_worker(jobs, feedback):
+    """Pipeline stage 2: send recordings to the server and emit UI commands, one at a time."""
+    while True:
+        wav_path = jobs.get()
+        if wav_path is None:
+            return
+        # Never let one bad recording kill the only upload thread (the queue would fill up)
+        try:
+            text = send_to_server(wav_path) or ""
+            try:
+                # Map recognized text to a UI view and emit a command file for the Tk UI
+                v = _map_simple(text)
+                if v:
+                    _emit_ui_command(v, text)
+            except Exception:
+                pass
+            suffix = "..." if len(text) > 60 else ""
+            _feedback(feedback, f"Heard: {text[:60]}{suffix}", 1.2)
+        except Exception as e:
+            print(f"[voice] processing {wav_path} failed: {type(e).__name__}: {e}")
+            _feedback(feedback, "Sorry, try again", 0.8)
+        finally:
+            if not OFFLINE_ONLY:    # offline mode exists to keep the recordings
+                try:
+                    os.remove(wav_path)
+                except OSError:
+                    pass
+
+def _feedback_worker(feedback):
+    """Pipeline stage 3: owns the Tk popup (Tk objects must stay on the thread that made them)."""
+    popup = _Popup()
+    hide_at = None
+    try:
+        while True:
+            timeout = 0.1 if hide_at is None else max(0.0, min(0.1, hide_at - time.time()))
+            try:
+                msg = feedback.get(timeout=timeout)
+            except queue.Empty:
+                msg = ()
+            if msg is None:
+                return
+            if msg:
+                text, hold = msg
+                popup.show(text)
+                hide_at = None if hold is None else time.time() + hold
+            elif hide_at is not None and time.time() >= hide_at:
+                popup.hide()
+                hide_at = None
+            else:
+                popup._pump()
+    finally:
+        popup.destroy()
+
 def main():
     global STOP
     if not ACCESS_KEY:
@@ -268,6 +579,8 @@ def main():
         )
         listen_desc = str(KEYWORDS)
 
+    # One continuous capture for the whole session: wake-word detection and command
+    # recording both read the same ring buffer, so the device is never closed/re-opened.
     # Try PvRecorder first. If it fails due to GLIBC or other runtime issues, fall back to arecord-based streaming.
     use_arecord_stream = False
     sel_index = DEVICE_INDEX
@@ -276,6 +589,7 @@ def main():
         rec.start()
         return rec
 
+    ring_sec = RECORD_SEC + PREROLL_MS / 1000.0 + 2.0
     try:
         # Allow selecting device by substring name via PVREC_DEVICE_NAME
         want_name = os.getenv("PVREC_DEVICE_NAME", "").strip().lower()
@@ -285,7 +599,8 @@ def main():
                     sel_index = i
                     print(f"Selected device by name match '{want_name}': index {sel_index} ({name})")
                     break
-        recorder = _restart_recorder()
+        capture = CaptureStream(PvRecorderSource(_restart_recorder), porcupine.frame_length, ring_sec)
+        capture.start()
         try:
             dev_name = PvRecorder.get_available_devices()[sel_index]
         except Exception:
@@ -295,170 +610,94 @@ def main():
         print(f"PvRecorder unavailable ({e}); falling back to arecord streaming.")
         use_arecord_stream = True
 
-    def _start_arecord_stream():
-        # 16kHz, 16-bit, mono raw stream on stdout
-        card = ARECORD_CARD
-        cmd = [
-            "arecord",
-            "-D", card,
-            "-f", "S16_LE",
-            "-r", "16000",
-            "-c", "1",
-            "-t", "raw",
-            "-q",
-        ]
-        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-    arec_proc = None
     if use_arecord_stream:
-        arec_proc = _start_arecord_stream()
+        capture = CaptureStream(ArecordSource(ARECORD_CARD, porcupine.frame_length), porcupine.frame_length, ring_sec)
+        capture.start()
         print(f"Listening for {listen_desc} via arecord stream on {ARECORD_CARD} (16k/mono)...")
 
-    popup = _Popup()
+    cursor = capture.cursor()
+    preroll_frames = int(PREROLL_MS / 1000.0 / capture.frame_sec)
+    # Pipeline: this loop only detects + records; uploads and popup updates run on their own
+    # threads behind bounded queues so the mic is listening again as soon as a command ends.
+    jobs = queue.Queue(maxsize=PIPELINE_DEPTH)
+    feedback = queue.Queue(maxsize=16)
+    workers = [
+        threading.Thread(target=_upload_worker, args=(jobs, feedback), name="voice-upload", daemon=True),
+        threading.Thread(target=_feedback_worker, args=(feedback,), name="voice-ui", daemon=True),
+    ]
+    for t in workers:
+        t.start()
     last_trigger = 0.0
+    # Wake-word detection keeps running while the clock speaks (barge-in)
+    gate = EchoGate().start()
+    wake_frames = max(1, int(0.6 / capture.frame_sec))
 
     try:
         while not STOP:
-            if use_arecord_stream:
-                # Read raw little-endian int16 samples from arecord
-                need = porcupine.frame_length * 2  # bytes
-                buf = arec_proc.stdout.read(need) if arec_proc and arec_proc.stdout else b""
-                if len(buf) != need:
-                    # stream hiccup; try restarting
-                    if arec_proc:
-                        try:
-                            arec_proc.terminate()
-                        except Exception:
-                            pass
-                    arec_proc = _start_arecord_stream()
-                    continue
-                # convert to list of int16
-                pcm = list(int.from_bytes(buf[i:i+2], byteorder='little', signed=True) for i in range(0, need, 2))
-            else:
-                pcm = recorder.read()          # 16-bit PCM @ 16 kHz
+            seq, pcm = cursor.next(timeout=1.0)
+            if pcm is None:
+                continue
+            playing = gate.playing()
+            if playing:
+                gate.observe(frame_features(pcm)[0])
             result = porcupine.process(pcm)
             if result >= 0:                # wake word index
                 now = time.time()
                 if now - last_trigger < COOLDOWN_SEC:
                     continue               # debounce
+                if playing:
+                    # Clock is talking: make sure this isn't its own voice, then cut it off
+                    mic = [frame_features(capture.ring.frame(q))[0]
+                           for q in range(seq + 1 - wake_frames, seq + 1) if capture.ring.frame(q) is not None]
+                    if not gate.accept(sum(mic) / max(1, len(mic))):
+                        continue
+                    gate.barge_in()
+                    print("[bargein] stopped playback")
                 last_trigger = now
 
                 print("Wake word detected!")
-                if popup:
-                    popup.show("Listening...")
-                # Free the device so 'arecord' can open it
-                if use_arecord_stream:
-                    try:
-                        if arec_proc:
-                            arec_proc.terminate()
-                            try:
-                                arec_proc.wait(timeout=0.5)
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                    arec_proc = None
-                    # Brief pause to let ALSA release the device before recording
-                    time.sleep(0.25)
-                else:
-                    # Fully release the device before spawning arecord
-                    try:
-                        recorder.stop()
-                    except Exception:
-                        pass
-                    try:
-                        recorder.delete()
-                    except Exception:
-                        pass
-                    recorder = None
+                journal_post({"cmd": "wake"})     # UI leaves night/idle mode right away
+                _feedback(feedback, "Listening...")
 
                 # (Optional) give a short beep/feedback here if you want:
                 # subprocess.run(["aplay", "-q", "/usr/share/sounds/alsa/Front_Center.wav"], check=False)
 
-                # Record then send
-                ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+                ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
                 wav_path = f"{SAVE_DIR}/wake_{ts}.wav"
                 try:
-                    record_wav(wav_path)
-                    if popup:
-                        popup.update("Recognizing...")
-                    text = send_to_server(wav_path)
-                    try:
-                        # Map recognized text to a UI view and emit a command file for the Tk UI
-                        def _map_simple(txt: str):
-                            t = (txt or "").strip().lower()
-                            if not t:
-                                return None
-                            pairs = [
-                                ("clock", ("clock", "\u6642\u8a08", "\u30af\u30ed\u30c3\u30af")),
-                                ("weather", ("weather", "\u5929\u6c17")),
-                                ("calendar", ("calendar", "\u30ab\u30ec\u30f3\u30c0\u30fc")),
-                                ("alarm", ("alarm", "\u30a2\u30e9\u30fc\u30e0")),
-                                ("voice", ("voice", "\u30dc\u30a4\u30b9", "\u9332\u97f3")),
-                            ]
-                            for v, keys in pairs:
-                                for k in keys:
-                                    if k in t:
-                                        return v
-                            return None
-                        v = _map_simple(text)
-                        if v:
-                            _emit_ui_command(v, text)
-                    except Exception:
-                        pass
-                    if popup:
-                        suffix = "..." if len(text) > 60 else ""
-                        popup.update(f"Heard: {text[:60]}{suffix}")
-                        # Briefly show the result
-                        time.sleep(1.2)
+                    # Cut the command from the live stream, starting a little before this frame
+                    record_utterance(capture, cursor, wav_path, seq + 1 - preroll_frames, onset_seq=seq + 1)
                 except subprocess.CalledProcessError as e:
-                    print(f"arecord failed: {e}")
-                    if popup:
-                        popup.update("Mic error")
-                        time.sleep(0.8)
-                except requests.RequestException as e:
-                    print(f"HTTP error: {e}")
-                    if popup:
-                        popup.update("Network error")
-                        time.sleep(0.8)
-                finally:
-                    # Resume wake-word listening
-                    if not STOP:
-                        if use_arecord_stream:
-                            arec_proc = _start_arecord_stream()
-                        else:
-                            try:
-                                recorder = _restart_recorder()
-                            except Exception as e:
-                                print(f"Could not restart recorder: {e}")
-                                STOP = True
-                    if popup:
-                        popup.hide()
-            # tiny sleep to avoid busy-looping; pvrecorder already blocks, so keep it minimal
-            # time.sleep(0.001)
+                    print(f"capture failed: {e}")
+                    _feedback(feedback, "Mic error", 0.8)
+                    cursor.seek_live()
+                    continue
+                try:
+                    jobs.put_nowait(wav_path)
+                    _feedback(feedback, "Recognizing...")
+                except queue.Full:
+                    print(f"[voice] {jobs.qsize()} commands still in flight; dropping {wav_path}")
+                    _feedback(feedback, "Busy, try again", 0.8)
+                    if not OFFLINE_ONLY:
+                        try:
+                            os.remove(wav_path)
+                        except OSError:
+                            pass
+                # Straight back to wake-word detection on live audio
 
     finally:
-        try:
-            if use_arecord_stream:
-                if arec_proc:
-                    arec_proc.terminate()
-            else:
-                if recorder:
-                    recorder.stop()
-        except Exception:
-            pass
-        if not use_arecord_stream:
+        for q in (jobs, feedback):
             try:
-                if recorder:
-                    recorder.delete()
-            except Exception:
+                q.put(None, timeout=1.0)
+            except queue.Full:
                 pass
-        porcupine.delete()
         try:
-            if popup:
-                popup.destroy()
+            capture.stop()
         except Exception:
             pass
+        porcupine.delete()
+        for t in workers:
+            t.join(timeout=2.0)
         print("Cleaned up. Bye!")
 
 if __name__ == "__main__":
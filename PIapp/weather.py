@@ -1,7 +1,7 @@
 import os
 import time
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageDraw, ImageFont
 import requests
 
 # Weather API key (override via env var WEATHERAPI_KEY)
@@ -104,7 +104,8 @@ def _draw_label_value(drw: ImageDraw.ImageDraw, left_x: int, y: int, right_x: in
     drw.text((right_x - vw, y), value, font=font, fill=color)
 
 
-def drawCurrentWather(weatherForecastData=None):
+def render_current_weather(weatherForecastData=None) -> Image.Image:
+    """Compose the weather page as a PIL image (safe to call off the Tk thread)."""
     image = Image.new("RGB", (windowWidth, windowHeight), "white")
     draw = ImageDraw.Draw(image)
 
@@ -113,7 +114,7 @@ def drawCurrentWather(weatherForecastData=None):
 
     if not weatherForecastData:
         draw.text((30, 30), "Weather unavailable (set WEATHERAPI_KEY).", font=_font(20), fill="#600000")
-        return ImageTk.PhotoImage(image)
+        return image
 
     city = weatherForecastData['location']['name']
     state = weatherForecastData['location']['region']
@@ -215,7 +216,12 @@ def drawCurrentWather(weatherForecastData=None):
         _draw_label_value(draw, col_left, y2TopMergin + y2ndRowOffset + 95,  col_right, col_labels[2], col_values[2], f20, "#600000")
         _draw_label_value(draw, col_left, y2TopMergin + y2ndRowOffset + 120, col_right, col_labels[3], col_values[3], f20, "#600000")
 
-    return ImageTk.PhotoImage(image)
+    return image
+
+
+def drawCurrentWather(weatherForecastData=None):
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(render_current_weather(weatherForecastData))
 
 
 # Optional alias with corrected spelling
@@ -2,6 +2,7 @@ import importlib
 import logging
 from typing import Callable, Iterable, Optional
 import json, os, tempfile
+from PIapp.cmd_journal import post as journal_post
 
 VOICE_CMD_PATH = os.getenv("VOICE_CMD_PATH", os.path.join(tempfile.gettempdir(), "cc_voice_cmd.json"))
 log = logging.getLogger("app_router")
@@ -27,6 +28,8 @@ VIEW_MAP = {
 }
 
 def _write(payload: dict):
+    if journal_post(payload):   # ordered journal + wake-up poke for the UI
+        return
     os.makedirs(os.path.dirname(VOICE_CMD_PATH), exist_ok=True)
     tmp = VOICE_CMD_PATH + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
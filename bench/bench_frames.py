@@ -0,0 +1,75 @@
+"""Micro-benchmark: per-frame cost of turning arecord PCM into Porcupine input.
+
+Compares the old per-sample int.from_bytes generator with PIapp.audio_capture.FrameReader
+(readinto + memoryview cast). Also times the ctypes array build Porcupine does internally,
+since that is paid either way.
+
+    python bench/bench_frames.py [--frames 3000] [--frame-length 512]
+
+At 16 kHz a 512-sample frame arrives every 32 ms; the "% of realtime" column is the
+share of that budget spent on decoding alone.
+"""
+
+import argparse
+import ctypes
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from PIapp.audio_capture import FrameReader  # noqa: E402
+
+
+def _legacy(stream, frame_length):
+    need = frame_length * 2
+    while True:
+        buf = stream.read(need)
+        if len(buf) != need:
+            return
+        yield list(int.from_bytes(buf[i:i+2], byteorder='little', signed=True) for i in range(0, need, 2))
+
+
+def _frame_reader(stream, frame_length):
+    reader = FrameReader(stream, frame_length)
+    while True:
+        pcm = reader.read()
+        if pcm is None:
+            return
+        yield pcm
+
+
+def _run(name, gen_factory, data, frame_length, frames, to_ctypes):
+    stream = io.BufferedReader(io.BytesIO(data))
+    t0 = time.perf_counter()
+    n = 0
+    for pcm in gen_factory(stream, frame_length):
+        if to_ctypes:
+            (ctypes.c_short * len(pcm))(*pcm)
+        n += 1
+    dt = time.perf_counter() - t0
+    us = dt / max(1, n) * 1e6
+    budget_us = frame_length / 16000.0 * 1e6
+    print(f"{name:<28} {us:9.1f} us/frame   {100.0 * us / budget_us:6.2f}% of realtime   ({n} frames)")
+    return us
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=3000)
+    ap.add_argument("--frame-length", type=int, default=512)
+    args = ap.parse_args(argv)
+
+    data = os.urandom(args.frames * args.frame_length * 2)
+    print(f"frame_length={args.frame_length} frames={args.frames}")
+    old = _run("legacy int.from_bytes", _legacy, data, args.frame_length, args.frames, False)
+    new = _run("FrameReader (memoryview)", _frame_reader, data, args.frame_length, args.frames, False)
+    _run("legacy + ctypes", _legacy, data, args.frame_length, args.frames, True)
+    _run("FrameReader + ctypes", _frame_reader, data, args.frame_length, args.frames, True)
+    print(f"decode speedup: {old / max(new, 1e-9):.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
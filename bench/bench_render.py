@@ -0,0 +1,181 @@
+"""Render benchmark: ms/frame and allocations for every page, headless.
+
+Uses the render_* functions that return PIL images, so no display or Tk is needed.
+Inputs are fixtures: a recorded WeatherAPI forecast (bench/fixtures), alarm lists of
+several sizes, and a pre-seeded icon cache, so nothing touches the network.
+
+    python bench/bench_render.py [--frames 60] [--save base.json] [--baseline base.json]
+
+Each case gets a few warm-up frames first, so glyph atlases, fonts and backgrounds are
+built before timing starts. Then it is timed for --frames frames. A shorter second pass
+under tracemalloc reports the Python-level peak and the bytes still held per frame; a
+growing "held" column points at caches and per-frame objects. tracemalloc does not see
+Pillow's pixel buffers, so the same pass also counts, per frame, the images Pillow created
+and the memory blocks its arena had to allocate fresh rather than reuse (from
+PIL.Image.core.get_stats()). With --baseline, the script exits 1 if any
+case's median ms/frame is more than --tolerance (default 20 %) slower than the baseline
+and also at least --min-delta-ms slower, which keeps sub-millisecond cases from flagging
+on jitter.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)    # clock.py resolves its font relative to the working directory
+
+from PIL import Image  # noqa: E402
+
+from PIapp import weather, calendarPage, Alarm, clock  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+WARMUP = 3
+
+
+def _load_weather():
+    with open(os.path.join(FIXTURES, "weatherapi_forecast.json"), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    # Pre-seed the icon cache with flat icons so the page never fetches
+    urls = ["http:" + data["current"]["condition"]["icon"]]
+    urls += ["http:" + d["day"]["condition"]["icon"] for d in data["forecast"]["forecastday"]]
+    for url in urls:
+        for size in (weather.ICON_SIZE_CURRENT, weather.ICON_SIZE_FORECAST):
+            weather._ICON_CACHE[(url, size)] = Image.new("RGBA", size, (240, 180, 40, 255))
+    return data
+
+
+def _alarms(n):
+    return [{"hour": (6 + i) % 24, "minute": (i * 7) % 60, "enabled": i % 3 != 0} for i in range(n)]
+
+
+def _clock_frames():
+    # Seconds change every frame and HH:MM once a minute, as on the device
+    t = [0]
+
+    def frame():
+        i = t[0]
+        t[0] += 1
+        return clock.render_clock("Mon", "2026/10/19", f"{7 + i // 60 % 12:02d}:{i // 60 % 60:02d}", f"{i % 60:02d}")
+    return frame
+
+
+def _clock_face_ticks():
+    # ClockFace's per-second work minus the Tk upload: compose only the dirty regions
+    face = clock.ClockFace()
+    clock._BG_CACHE["img"] = clock._build_background("2026/10/19 | Mon")
+    clock._BG_CACHE["key"] = "2026/10/19 | Mon"
+    t = [0]
+
+    def frame():
+        i = t[0]
+        t[0] += 1
+        d1 = face._set_layer("hhmm", f"{7 + i // 60 % 12:02d}:{i // 60 % 60:02d}", clock._build_hhmm_tile, clock._HHMM_POS)
+        d2 = face._set_layer("sec", f"{i % 60:02d}", clock._build_sec_tile, clock._SEC_POS)
+        return [face._compose(b) for b in (d1, d2) if b is not None]
+    return frame
+
+
+def _cases():
+    data = _load_weather()
+    cases = {
+        "clock (full frame)": _clock_frames(),
+        "clock (dirty regions)": _clock_face_ticks(),
+        "calendar": lambda: calendarPage.render_calendar_image(1024, 600, 24),
+        "weather": lambda: weather.render_current_weather(data),
+    }
+    for n in (1, 12, 60):
+        items = _alarms(n)
+        cases[f"alarm ({n} alarms)"] = (
+            lambda items=items: Alarm.render_alarm(items[0]["hour"], items[0]["minute"], True, 1, len(items),
+                                                   [dict(a) for a in items], 0, {1, 2} if len(items) > 2 else set()))
+    return cases
+
+
+def _time(fn, frames):
+    samples = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def _pil_stats():
+    get_stats = getattr(Image.core, "get_stats", None)    # Pillow >= 5.2
+    return get_stats() if get_stats else {}
+
+
+def _allocs(fn, frames):
+    pil0 = _pil_stats()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for _ in range(frames):
+        fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    pil1 = _pil_stats()
+
+    def pil(key):
+        return (pil1.get(key, 0) - pil0.get(key, 0)) / frames
+    return ((peak - base) / 1024, (current - base) / 1024 / frames,
+            pil("new_count"), pil("allocated_blocks"))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=60)
+    ap.add_argument("--alloc-frames", type=int, default=10)
+    ap.add_argument("--only", help="run cases whose name contains this text")
+    ap.add_argument("--save", help="write results as JSON (use as a future --baseline)")
+    ap.add_argument("--baseline", help="JSON from an earlier --save to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.20)
+    ap.add_argument("--min-delta-ms", type=float, default=0.5)
+    args = ap.parse_args(argv)
+
+    base = {}
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            base = json.load(f)
+
+    results, failures = {}, []
+    print(f"{'case':<24} {'ms/frame':>9} {'p95':>8} {'py peak KB':>11} {'held KB/frame':>14} "
+          f"{'PIL imgs/frame':>15} {'PIL blocks/frame':>17}   vs baseline")
+    for name, fn in _cases().items():
+        if args.only and args.only not in name:
+            continue
+        for _ in range(WARMUP):
+            fn()
+        median, p95 = _time(fn, args.frames)
+        peak_kb, held_kb, pil_images, pil_blocks = _allocs(fn, args.alloc_frames)
+        results[name] = {"ms": round(median, 3), "p95_ms": round(p95, 3), "peak_kb": round(peak_kb, 1),
+                         "held_kb_per_frame": round(held_kb, 2), "pil_images_per_frame": round(pil_images, 1),
+                         "pil_blocks_per_frame": round(pil_blocks, 1)}
+        cmp = ""
+        ref = (base.get(name) or {}).get("ms")
+        if ref:
+            change = (median - ref) / ref
+            cmp = f"{change * 100:+6.1f}%"
+            if change > args.tolerance and median - ref >= args.min_delta_ms:
+                failures.append(f"{name}: {median:.2f} ms/frame vs baseline {ref:.2f}")
+                cmp += "  <-- regression"
+        print(f"{name:<24} {median:9.2f} {p95:8.2f} {peak_kb:11.0f} {held_kb:14.2f} "
+              f"{pil_images:15.1f} {pil_blocks:17.1f}   {cmp}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    for msg in failures:
+        print("REGRESSION:", msg)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
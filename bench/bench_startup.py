@@ -0,0 +1,120 @@
+"""Startup budget: import cost per entry point and time-to-first-frame of the UI.
+
+Each measurement runs in a fresh interpreter. For every entry point the script reports
+the median import time. It also lists which heavy modules the import dragged in: a bare
+`import main` must not load Tk, PIL, Porcupine, pandas or requests. With a display
+available, `--ui` starts `main.py ui --windowed` with UI_EXIT_AFTER_FIRST_FRAME=1 and
+reads the "First frame after N ms" line it prints.
+
+    python bench/bench_startup.py [--runs 5] [--ui] [--save base.json] [--baseline base.json]
+
+With --baseline, the script exits 1 if any number is more than --tolerance (default 25 %)
+slower than the baseline, or if a forbidden module shows up.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+HEAVY = ("tkinter", "PIL", "pvporcupine", "pvrecorder", "pandas", "numpy", "requests", "faster_whisper")
+
+# module -> heavy modules it is NOT allowed to pull in
+ENTRY_POINTS = {
+    "main": HEAVY,
+    "PIapp.clock": ("pvporcupine", "pvrecorder", "pandas", "requests"),
+    "PIapp.calendarPage": ("pandas", "numpy", "requests"),
+    "PIapp.weather": ("pvporcupine", "pandas"),
+    "PIapp.Alarm": ("pvporcupine", "pandas", "requests"),
+    "PIapp.pi_tts": ("tkinter", "PIL", "pandas"),
+    "PIapp.voiceRecognition": ("PIL", "pandas"),
+}
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {mod}
+dt = time.perf_counter() - t0
+print(json.dumps({{"ms": dt * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _import_probe(mod, runs):
+    times, loaded, error = [], [], None
+    for _ in range(runs):
+        res = subprocess.run([sys.executable, "-c", _PROBE.format(mod=mod, heavy=HEAVY)],
+                             cwd=ROOT, capture_output=True, text=True)
+        if res.returncode != 0:
+            error = (res.stderr.strip().splitlines() or ["failed"])[-1]
+            break
+        out = json.loads(res.stdout.strip().splitlines()[-1])
+        times.append(out["ms"])
+        loaded = out["loaded"]
+    return (statistics.median(times) if times else None), loaded, error
+
+
+def _first_frame(runs):
+    env = dict(os.environ, UI_EXIT_AFTER_FIRST_FRAME="1")
+    times = []
+    for _ in range(runs):
+        res = subprocess.run([sys.executable, "main.py", "ui", "--windowed"], cwd=ROOT, env=env,
+                             capture_output=True, text=True, timeout=120)
+        m = re.search(r"First frame after (\d+) ms", res.stdout)
+        if not m:
+            print("  UI did not report a first frame:", (res.stderr.strip().splitlines() or ["?"])[-1])
+            return None
+        times.append(float(m.group(1)))
+    return statistics.median(times)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--ui", action="store_true", help="also measure time-to-first-frame (needs a display)")
+    ap.add_argument("--save", help="write results as JSON (use as a future --baseline)")
+    ap.add_argument("--baseline", help="JSON from an earlier --save to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    args = ap.parse_args(argv)
+
+    results, failures = {}, []
+    print(f"{'entry point':<26} {'import ms':>10}   heavy modules loaded")
+    for mod, forbidden in ENTRY_POINTS.items():
+        ms, loaded, error = _import_probe(mod, args.runs)
+        if error:
+            print(f"{mod:<26} {'-':>10}   (skipped: {error})")
+            continue
+        results[f"import:{mod}"] = ms
+        bad = [m for m in loaded if m in forbidden]
+        print(f"{mod:<26} {ms:10.1f}   {', '.join(loaded) or '-'}" + (f"   <-- must not load {bad}" if bad else ""))
+        if bad:
+            failures.append(f"{mod} loads {', '.join(bad)}")
+
+    if args.ui:
+        ms = _first_frame(args.runs)
+        if ms is not None:
+            results["first_frame"] = ms
+            print(f"{'time-to-first-frame':<26} {ms:10.1f}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        for key, ms in results.items():
+            ref = base.get(key)
+            if ref and ms > ref * (1 + args.tolerance):
+                failures.append(f"{key}: {ms:.1f} ms vs baseline {ref:.1f} ms")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    for msg in failures:
+        print("REGRESSION:", msg)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,23 +1,36 @@
+import time
+
+_T_START = time.monotonic()     # time-to-first-frame is measured from here
+
 import argparse
+import importlib
 import os
 import subprocess
 import sys
 import tempfile
-import time
 from pathlib import Path
 from typing import Optional
 
-import requests
 from dotenv import load_dotenv
 
-from PIapp.voiceRecognition import get_intent
-from PIapp.nlu import get_intent
-from app_router import goto_view, schedule_alarm
+# Subcommands and pages import their own dependencies on first use: `main.py voice`
+# shouldn't load Tk/PIL, and the UI shouldn't load Porcupine, pandas or requests before
+# the clock is on screen. bench/bench_startup.py checks this stays true.
 
 BASE_DIR = Path(__file__).resolve().parent / "PIapp"
 load_dotenv(BASE_DIR / ".env")
 
 VOICE_CMD_PATH = os.getenv("VOICE_CMD_PATH", os.path.join(tempfile.gettempdir(), "cc_voice_cmd.json"))
+FIRST_FRAME_BUDGET_MS = float(os.getenv("UI_FIRST_FRAME_BUDGET_MS", "2500"))
+EXIT_AFTER_FIRST_FRAME = os.getenv("UI_EXIT_AFTER_FIRST_FRAME", "0") == "1"   # used by bench_startup
+
+
+def _lazy(module: str, attr: Optional[str] = None):
+    """Callable that imports `module` when first called, then forwards to `attr` (or returns the module)."""
+    def call(*args, **kwargs):
+        mod = importlib.import_module(module)
+        return getattr(mod, attr)(*args, **kwargs) if attr else mod
+    return call
 
 
 def run_clock(windowed: bool = False):
@@ -42,6 +55,7 @@ def show_calendar():
 
 
 def route_intent(intent: dict):
+    from app_router import goto_view, schedule_alarm
     it = (intent or {}).get("intent")
     if it == "goto":
         view = (intent.get("view") or "").lower()
@@ -56,6 +70,7 @@ def route_intent(intent: dict):
 
 
 def handle_recognized_text(text: str):
+    from PIapp.nlu import get_intent
     intent = get_intent(text)
     print("NLU:", intent)
     route_intent(intent)
@@ -98,29 +113,18 @@ print("UI VOICE_CMD_PATH:", VOICE_CMD_PATH)
 
 
 def run_touch_ui(fullscreen: bool = True):
-    from PIapp.pi_tts import speak
+    from PIapp.ui_bus import open_inbox
+    from PIapp.cmd_journal import JournalReader
+    from PIapp.scheduler import Scheduler
+    from PIapp.render_worker import TkHandoff, RenderWorker, FrameCache
+    from PIapp.splash import load_photo as load_splash, load_state as load_splash_state, SplashWriter
+    from PIapp.power import PowerManager, NIGHT_COLOR, NIGHT_FONT
     try:
         import tkinter as tk
     except Exception as e:
         print("Tkinter is not available. Install python3-tk (Debian/RPi) or ensure Tk is included.")
         print(f"Detail: {e}")
         return 1
-    try:
-        from PIL import ImageTk
-    except Exception as e:
-        print("Pillow is not installed. Run: pip install pillow")
-        print(f"Detail: {e}")
-        return 1
-    # Import page modules directly
-    try:
-        from PIapp.clock import drawClock as draw_clock_page
-        import PIapp.weather as weather_mod
-        from PIapp.calendarPage import draw_calendar_image as draw_calendar_page
-        from PIapp.Alarm import draw_alarm as draw_alarm_page, get_layout as alarm_layout
-    except Exception as e:
-        print("Failed to import page modules (clock/weather/calendar/alarm).")
-        print(f"Detail: {e}")
-        return 1
 
     WINDOW_W, WINDOW_H = 1024, 600
     BASE_DIR_ABS = os.path.abspath(os.path.dirname(__file__))
@@ -137,19 +141,78 @@ def run_touch_ui(fullscreen: bool = True):
         root.attributes("-fullscreen", True)
     root.configure(bg="black")
 
-    label = tk.Label(root)
-    label.pack()
+    # Pages are canvas image items so a swipe can slide them (tag "strip") without re-rendering
+    canvas = tk.Canvas(root, width=WINDOW_W, height=WINDOW_H, bg="white", highlightthickness=0, bd=0)
+    canvas.pack()
+    page_item = canvas.create_image(0, 0, anchor="nw", tags=("strip",))
+    shown = {"photo": None}
+
+    # Last run's frame goes up before Pillow, fonts and pages load; live content replaces it
+    splash = load_splash(root)
+    if splash is not None:
+        canvas.itemconfigure(page_item, image=splash)
+        shown["photo"] = splash
+        root.update()
+        print(f"Splash after {(time.monotonic() - _T_START) * 1000:.0f} ms")
 
     try:
-        speak("Companion Clock is ready.")
+        from PIL import ImageTk
+    except Exception as e:
+        print("Pillow is not installed. Run: pip install pillow")
+        print(f"Detail: {e}")
+        root.destroy()
+        return 1
+    # Only the clock is needed for the first frame. The other pages (and speech, which
+    # pulls in requests) are imported on first use, page modules on the render thread.
+    try:
+        from PIapp.clock import ClockFace
     except Exception as e:
-        print("TTS startup error:", e)
+        print("Failed to import the clock page.")
+        print(f"Detail: {e}")
+        root.destroy()
+        return 1
+    tts = _lazy("PIapp.pi_tts")
+    render_calendar_page = _lazy("PIapp.calendarPage", "render_calendar_image")
+    render_current_weather = _lazy("PIapp.weather", "render_current_weather")
+    get_weather_forecast = _lazy("PIapp.weather", "getWeatherForecast")
+    render_alarm_page = _lazy("PIapp.Alarm", "render_alarm")
+    alarm_layout = _lazy("PIapp.Alarm", "get_layout")
+
+    clock_face = ClockFace()   # persistent image; only changed digits are repainted each tick
+
+    def _report_tts_error(what: str):
+        def _done(fut):
+            if fut.cancelled():
+                return
+            e = fut.exception()
+            if e is not None:
+                print(f"TTS {what} error:", e)
+        return _done
+
+    def _start_speech():
+        # Runs once the first frame is up, off the Tk thread: the imports and the first TTS
+        # request used to sit in front of the clock appearing.
+        try:
+            from PIapp.bargein import start_ui_link
+            t = tts()
+            t.speak_async("Companion Clock is ready.").add_done_callback(_report_tts_error("startup"))
+            # Warm the on-disk phrase cache so announcements play instantly (and offline)
+            t.prefetch()
+            # Wake word while talking: drop command/info speech (alarm speech keeps going)
+            start_ui_link(lambda: t.get_speech_service().cancel_all(min_priority=t.PRIO_COMMAND))
+        except Exception as e:
+            print("Speech startup failed:", e)
 
-    # State
+    # State (view and last weather carry over from the previous run)
+    boot_state = load_splash_state()
     mode = {"view": "clock"}  # calendar | weather | clock | alarm
+    if boot_state.get("view") in {"clock", "weather", "calendar", "alarm"}:
+        mode["view"] = boot_state["view"]
     api_key: Optional[str] = os.getenv("WEATHERAPI_KEY")
-    weather_data: Optional[dict] = None
-    last_fetch = 0.0
+    weather_data: Optional[dict] = boot_state.get("weather") if isinstance(boot_state.get("weather"), dict) else None
+    # Age of the restored weather is its fetch time, not when the splash was saved
+    last_fetch = float(boot_state.get("weather_ts") or 0.0) if weather_data is not None else 0.0
+    splash_writer = SplashWriter()
     alarms = {"items": [{"hour": 7, "minute": 0, "enabled": False}], "i": 0, "checked": set()}
     RANG_RECENT = set()
     _last_date = {"d": time.strftime("%Y-%m-%d")}
@@ -157,12 +220,11 @@ def run_touch_ui(fullscreen: bool = True):
     # Voice command inbox (simple file-based IPC with voiceRecognition.py)
     voice_cmd_state = {"last_mtime": 0.0}
     view_state = {"last": None}
-    cache = {
-        "weather": {"img": None, "stamp": None},
-        "calendar": {"img": None, "ym": None},
-        "alarm": {"img": None, "sig": None},
-    }
-    alarm_sound = {"path": None}
+    # Finished page frames (current page + neighbours), kept warm so swipes are instant
+    frames = FrameCache(max_items=4)
+    handoff = TkHandoff(root)          # worker threads -> Tk thread
+    renderer = RenderWorker(handoff)
+    alarm_sound = {"path": None, "pcm": None}
 
     def _ensure_alarm_sound() -> Optional[str]:
         """Create a small WAV beep for the alarm if it doesn't exist."""
@@ -213,6 +275,18 @@ def run_touch_ui(fullscreen: bool = True):
                 return True
             except Exception as e:
                 print("Alarm sound playback failed (winsound):", e)
+        # Shared audio sink: no process spawn / device open, mixes with (and ducks under) speech
+        from PIapp.audio_out import get_sink, load_wav_pcm
+        sink = get_sink()
+        if sink is not None:
+            try:
+                if alarm_sound.get("pcm") is None:
+                    alarm_sound["pcm"] = load_wav_pcm(path, sink.rate)
+                if alarm_sound["pcm"] is not None:
+                    sink.play(alarm_sound["pcm"], channel="alarm")
+                    return True
+            except Exception as e:
+                print("Alarm sound playback failed (sink):", e)
         # POSIX: try aplay
         try:
             res = subprocess.run(
@@ -224,70 +298,171 @@ def run_touch_ui(fullscreen: bool = True):
             print("Alarm sound playback failed (aplay):", e)
         return False
 
-    def render():
-        nonlocal weather_data
-        v = mode["view"]
+    def _page_job(v):
+        """(signature, PIL render fn, args) describing what page v should show right now."""
         if v == "calendar":
-            ym = time.strftime("%Y-%m")
-            if cache["calendar"]["img"] is None or cache["calendar"]["ym"] != ym:
-                tkimg = draw_calendar_page(WINDOW_W, WINDOW_H, top_margin=24)
-                cache["calendar"]["img"], cache["calendar"]["ym"] = tkimg, ym
-            else:
-                tkimg = cache["calendar"]["img"]
-        elif v == "weather":
+            return time.strftime("%Y-%m"), render_calendar_page, (WINDOW_W, WINDOW_H, 24)
+        if v == "weather":
             stamp = None
             try:
                 if isinstance(weather_data, dict):
                     stamp = weather_data.get("current", {}).get("last_updated")
             except Exception:
                 stamp = None
-            if cache["weather"]["img"] is None or cache["weather"]["stamp"] != stamp:
-                tkimg = weather_mod.drawCurrentWeather(weather_data)
-                cache["weather"]["img"], cache["weather"]["stamp"] = tkimg, stamp
-            else:
-                tkimg = cache["weather"]["img"]
-        elif v == "alarm":
-            cur = alarms["items"][alarms["i"]]
-            sig = (
-                tuple((a.get('hour', 0), a.get('minute', 0), a.get('enabled', False)) for a in alarms["items"]),
-                alarms["i"],
-                tuple(sorted(list(alarms["checked"]))),
-            )
-            if cache["alarm"]["img"] is None or cache["alarm"]["sig"] != sig:
-                tkimg = draw_alarm_page(
-                    cur["hour"],
-                    cur["minute"],
-                    cur.get("enabled", False) if isinstance(cur, dict) else False,
-                    index=alarms["i"] + 1,
-                    total=len(alarms["items"]),
-                    alarms=alarms["items"],
-                    selected=alarms["i"],
-                    checked=alarms["checked"],
-                )
-                cache["alarm"]["img"], cache["alarm"]["sig"] = tkimg, sig
-            else:
-                tkimg = cache["alarm"]["img"]
-        else:  # clock
+            # No data (no key, offline first boot) still needs a frame: the "unavailable" page
+            return stamp or ("none",), render_current_weather, (weather_data,)
+        cur = alarms["items"][alarms["i"]]
+        sig = (
+            tuple((a.get('hour', 0), a.get('minute', 0), a.get('enabled', False)) for a in alarms["items"]),
+            alarms["i"],
+            tuple(sorted(list(alarms["checked"]))),
+        )
+        # Snapshot the mutable alarm state; the worker thread must not see it change mid-draw
+        args = (
+            cur["hour"],
+            cur["minute"],
+            cur.get("enabled", False) if isinstance(cur, dict) else False,
+            alarms["i"] + 1,
+            len(alarms["items"]),
+            [dict(a) for a in alarms["items"]],
+            alarms["i"],
+            set(alarms["checked"]),
+        )
+        return sig, render_alarm_page, args
+
+    def _show(v, tkimg):
+        if shown["photo"] is not tkimg:
+            canvas.itemconfigure(page_item, image=tkimg)
+            shown["photo"] = tkimg
+        view_state["last"] = v
+
+    def _on_page_rendered(v, sig, image):
+        # Tk thread: the only step that touches Tk is wrapping the finished frame
+        tkimg = ImageTk.PhotoImage(image)
+        frames.put(v, sig, tkimg, image)
+        if mode["view"] == v and _page_job(v)[0] == sig:
+            _show(v, tkimg)
+
+    # Pages reachable by one swipe from each view (see on_release)
+    NEIGHBOURS = {
+        "clock": ("weather", "calendar", "alarm"),
+        "calendar": ("clock",),
+        "weather": ("clock",),
+        "alarm": ("clock",),
+    }
+
+    def prefetch_neighbours(v):
+        for n in NEIGHBOURS.get(v, ()):
+            if n == "clock":
+                continue    # ClockFace is always current
+            sig, fn, args = _page_job(n)
+            if frames.get(n, sig) is None and renderer.pending(n) != sig:
+                renderer.submit(n, sig, fn, args, _on_page_rendered, urgent=False)
+
+    # Low-power faces are plain canvas items: no PIL work and one redraw a minute
+    night_item = canvas.create_text(WINDOW_W // 2, WINDOW_H // 2, text="", fill=NIGHT_COLOR,
+                                    font=(NIGHT_FONT, 180), state="hidden")
+
+    def _apply_power(state, reason):
+        low = state != "full"
+        canvas.configure(bg="black" if low else "white")
+        canvas.itemconfigure(page_item, state="hidden" if low else "normal")
+        canvas.itemconfigure(night_item, state="normal" if state == "minimal" else "hidden")
+        # Alarm job is left on its 1 s grid so alarms still fire on time
+        sched.set_period("clock", 60.0 if low else 1.0)
+        sched.set_period("weather", 300.0 if low else 30.0)
+        render()
+
+    power = PowerManager(on_change=_apply_power)
+
+    def render():
+        if power.state != "full":
+            if power.state == "minimal":
+                canvas.itemconfigure(night_item, text=time.strftime("%H:%M"))
+            return
+        v = mode["view"]
+        if v == "clock":
             day_name = time.strftime("%a")
             today = time.strftime("%Y/%m/%d")
             current_time = time.strftime("%H:%M")
             current_sec = time.strftime("%S")
-            tkimg = draw_clock_page(day_name, today, current_time, current_sec)
-        label.config(image=tkimg)
-        label.image = tkimg
-        view_state["last"] = v
+            _show(v, clock_face.render(day_name, today, current_time, current_sec))
+        else:
+            sig, fn, args = _page_job(v)
+            entry = frames.get(v, sig)
+            if entry is not None:
+                _show(v, entry["photo"])
+            elif renderer.pending(v) != sig:
+                # Composed off the Tk thread; the current frame stays up until it's ready
+                renderer.submit(v, sig, fn, args, _on_page_rendered)
+        prefetch_neighbours(v)
+
+    def apply_voice_cmds(cmds):
+        if cmds:
+            power.activity()
+        for payload in cmds:
+            if not isinstance(payload, dict):
+                continue
+            cmd = str(payload.get("cmd", "")).lower()
+
+            if cmd == "wake":
+                pass    # wake word heard: power.activity() above already restored the display
+
+            elif cmd == "goto":
+                dest = str(payload.get("view", "")).lower()
+                if dest in {"clock", "weather", "calendar", "alarm"}:
+                    mode["view"] = dest
+
+            elif cmd == "set_alarm":
+                hhmm = str(payload.get("time", "")).strip()
+                try:
+                    h, m = [int(x) for x in hhmm.split(":", 1)]
+                    key = (h, m)
+                    if not any((a.get("hour"), a.get("minute")) == key for a in alarms["items"]):
+                        alarms["items"].append({"hour": h, "minute": m, "enabled": True})
+                        alarms["i"] = len(alarms["items"]) - 1
+                        mode["view"] = "alarm"
+                    if not payload.get("spoken"):
+                        tts().announce("alarm_set", time=f"{h:02d}:{m:02d}").add_done_callback(
+                            _report_tts_error("alarm confirmation"))
+                except Exception:
+                    pass
+
+                goto = payload.get("goto")
+                if goto in {"clock", "weather", "calendar", "alarm"}:
+                    mode["view"] = goto
+
+    voice_journal = JournalReader()
+
+    def pump_voice_cmds(direct=()):
+        # Runs on the Tk thread (socket poke or scheduler): apply every new journal record in order
+        try:
+            cmds = list(direct) + voice_journal.read_batch()
+            if not cmds:
+                return
+            apply_voice_cmds(cmds)
+            if view_state.get("last") != mode.get("view") or any(c.get("cmd") == "set_alarm" for c in cmds):
+                render()
+        except Exception as e:
+            print("Voice command failed:", e)
+
+    # Event-driven voice commands; the scheduler also polls the journal (and legacy VOICE_CMD_PATH)
+    voice_inbox = open_inbox(root, pump_voice_cmds)
 
-    timer = {"id": None}
     weather_fetching = {"busy": False}
 
-    def tick():
-        nonlocal last_fetch, weather_data
-        now = time.time()
+    # Periodic duties, each on its own cadence; the scheduler keeps them on the wall-clock grid
+    def clock_job():
         today = time.strftime("%Y-%m-%d")
         if today != _last_date["d"]:
             RANG_RECENT.clear()
             _last_date["d"] = today
+        if power.state != "full" or mode["view"] == "clock" or view_state.get("last") != mode.get("view"):
+            render()
 
+    def weather_job():
+        nonlocal last_fetch, weather_data
+        now = time.time()
         if api_key and (now - last_fetch > 600 or weather_data is None) and not weather_fetching["busy"]:
             weather_fetching["busy"] = True
             import threading
@@ -295,26 +470,28 @@ def run_touch_ui(fullscreen: bool = True):
             def _do_fetch():
                 nonlocal weather_data, last_fetch
                 try:
-                    data = weather_mod.getWeatherForecast(api_key, 3)
+                    data = get_weather_forecast(api_key, 3)
                 except Exception:
                     data = None
 
                 def _apply():
                     nonlocal weather_data, last_fetch
+                    weather_fetching["busy"] = False
+                    if data is None and weather_data is not None:
+                        return      # offline: keep showing the restored/previous data, retry next run
                     weather_data = data
                     last_fetch = time.time()
-                    weather_fetching["busy"] = False
                     if mode["view"] == "weather":
                         render()
 
-                root.after(0, _apply)
+                handoff.post(_apply)   # root.after() is not safe from this thread
 
             threading.Thread(target=_do_fetch, daemon=True).start()
 
-        VOICE_POLL_EVERY = 2.0
-        voice_poll_ok = now - voice_cmd_state.get("last_check", 0.0) > VOICE_POLL_EVERY
+    def voice_file_job():
+        # Legacy VOICE_CMD_PATH inbox (writers fall back to it when the journal is unavailable)
         try:
-            if voice_poll_ok and os.path.exists(VOICE_CMD_PATH):
+            if os.path.exists(VOICE_CMD_PATH):
                 mt = os.path.getmtime(VOICE_CMD_PATH)
                 if mt > voice_cmd_state.get("last_mtime", 0):
                     import json
@@ -323,43 +500,16 @@ def run_touch_ui(fullscreen: bool = True):
                         payload = json.load(f)
                     voice_cmd_state["last_mtime"] = mt
 
-                    cmds = payload if isinstance(payload, list) else [payload]
-                    for payload in cmds:
-                        if not isinstance(payload, dict):
-                            continue
-                        cmd = str(payload.get("cmd", "")).lower()
-
-                        if cmd == "goto":
-                            dest = str(payload.get("view", "")).lower()
-                            if dest in {"clock", "weather", "calendar", "alarm"}:
-                                mode["view"] = dest
-
-                        elif cmd == "set_alarm":
-                            hhmm = str(payload.get("time", "")).strip()
-                            try:
-                                h, m = [int(x) for x in hhmm.split(":", 1)]
-                                key = (h, m)
-                                if not any((a.get("hour"), a.get("minute")) == key for a in alarms["items"]):
-                                    alarms["items"].append({"hour": h, "minute": m, "enabled": True})
-                                    alarms["i"] = len(alarms["items"]) - 1
-                                    mode["view"] = "alarm"
-                            except Exception:
-                                pass
-
-                            goto = payload.get("goto")
-                            if goto in {"clock", "weather", "calendar", "alarm"}:
-                                mode["view"] = goto
+                    apply_voice_cmds(payload if isinstance(payload, list) else [payload])
 
                     try:
                         os.remove(VOICE_CMD_PATH)
                     except Exception:
                         pass
-
-            if voice_poll_ok:
-                voice_cmd_state["last_check"] = now
         except Exception:
             pass
 
+    def alarm_job():
         try:
             now_h = int(time.strftime("%H"))
             now_m = int(time.strftime("%M"))
@@ -372,19 +522,40 @@ def run_touch_ui(fullscreen: bool = True):
                     continue
                 if a.get("hour") == now_h and a.get("minute") == now_m:
                     played = play_alarm_sound()
-                    try:
-                        speak("Alarm ringing.")
-                    except Exception as e:
-                        print("TTS alarm error:", e)
-                        if not played:
-                            print("No alarm sound played.")
+                    if not played:
+                        print("No alarm sound played.")
+                    # Alarm pre-empts any chatter that is currently playing
+                    t = tts()
+                    t.speak_async("Alarm ringing.", priority=t.PRIO_ALARM, interrupt=True).add_done_callback(
+                        _report_tts_error("alarm"))
                     RANG_RECENT.add(key)
+                    power.activity()
         except Exception:
             pass
 
-        if mode["view"] == "clock" or view_state.get("last") != mode.get("view"):
-            render()
-        timer["id"] = root.after(1000, tick)
+    def _current_frame_image():
+        v = view_state.get("last")
+        if v == "clock":
+            return clock_face.snapshot()
+        entry = frames.get(v) if v else None
+        return entry["image"] if entry is not None else None
+
+    def splash_job(force=False):
+        v = view_state.get("last")
+        if power.state != "full" and not force:
+            return
+        if v and (force or splash_writer.due(v)):
+            splash_writer.save(_current_frame_image(), v, weather_data, last_fetch, block=force)
+
+    sched = Scheduler(root)
+    sched.every("clock", 1.0, clock_job, align=True, offset=0.005)   # just after each second flips
+    sched.every("alarm", 1.0, alarm_job, align=True, offset=0.010)
+    sched.every("weather", 30.0, weather_job, run_now=True)
+    sched.every("voice_journal", 1.0, pump_voice_cmds)   # cheap stat(); covers a missed socket poke
+    sched.every("voice_file", 2.0, voice_file_job)
+    sched.every("splash", 10.0, splash_job)   # saves only on a view change or every UI_SPLASH_SAVE_SEC
+    if power.enabled:
+        sched.every("power", 10.0, power.evaluate)
 
     SWIPE_MIN_DIST = 80
     SWIPE_MAX_TIME = 0.8
@@ -414,7 +585,100 @@ def run_touch_ui(fullscreen: bool = True):
         i = max(0, i - 1)
         mode["view"] = PAGES[i]
 
+    # Drag-following horizontal transitions. On drag start the neighbours' cached frames are
+    # placed left/right of the page as one "strip"; motion just moves the strip (coalesced to
+    # one canvas move per frame), release animates it home or onto the neighbour.
+    DRAG_START_PX = 12
+    DRAG_FRAME_MS = 16
+    drag = {"on": False, "want": 0, "offset": 0, "pending": False, "anim": None,
+            "left": None, "right": None, "items": []}
+
+    def _frame_photo(v):
+        if v == "clock":
+            return clock_face.photo
+        entry = frames.get(v)     # a slightly stale frame is fine while sliding
+        return entry["photo"] if entry is not None else None
+
+    def _drag_begin():
+        i = PAGES.index(mode["view"])
+        drag.update(on=True, want=0, offset=0,
+                    left=PAGES[i - 1] if i > 0 else None,
+                    right=PAGES[i + 1] if i + 1 < len(PAGES) else None)
+        for v, x in ((drag["left"], -WINDOW_W), (drag["right"], WINDOW_W)):
+            if v is None:
+                continue
+            photo = _frame_photo(v)
+            if photo is not None:
+                item = canvas.create_image(x, 0, anchor="nw", image=photo, tags=("strip",))
+            else:
+                item = canvas.create_rectangle(x, 0, x + WINDOW_W, WINDOW_H, fill="white", width=0, tags=("strip",))
+            drag["items"].append(item)
+
+    def _drag_apply():
+        drag["pending"] = False
+        delta = drag["want"] - drag["offset"]
+        if delta:
+            canvas.move("strip", delta, 0)
+            drag["offset"] = drag["want"]
+
+    def _drag_to(x):
+        # Coalesce motion events: at most one canvas move per frame, always to the latest position
+        drag["want"] = int(x)
+        if not drag["pending"]:
+            drag["pending"] = True
+            root.after(DRAG_FRAME_MS, _drag_apply)
+
+    def _drag_end(new_view):
+        for item in drag["items"]:
+            canvas.delete(item)
+        drag.update(on=False, items=[], anim=None, want=0, offset=0)
+        canvas.coords(page_item, 0, 0)
+        if new_view:
+            mode["view"] = new_view
+        render()
+        v = mode["view"]
+        if view_state["last"] != v:
+            # Not composed yet: keep what the strip just slid in (a stale frame or blank white)
+            # instead of flashing the old page, until _on_page_rendered swaps the real one in
+            photo = _frame_photo(v)
+            canvas.itemconfigure(page_item, image=photo if photo is not None else "")
+            shown["photo"] = photo
+
+    def _drag_settle(target, new_view):
+        def step():
+            rem = target - drag["offset"]
+            if abs(rem) <= 2:
+                _drag_end(new_view)
+                return
+            move = rem * 0.35
+            move = max(8, abs(move)) * (1 if rem > 0 else -1)
+            if abs(move) > abs(rem):
+                move = rem
+            drag["want"] = drag["offset"] + int(move)
+            _drag_apply()
+            drag["anim"] = root.after(DRAG_FRAME_MS, step)
+        step()
+
+    def on_motion(evt):
+        if not gesture["active"] or drag["anim"] is not None:
+            return
+        dx = evt.x - gesture["x"]
+        dy = evt.y - gesture["y"]
+        if not drag["on"]:
+            if mode["view"] not in PAGES or abs(dx) < DRAG_START_PX or abs(dx) <= abs(dy):
+                return
+            _drag_begin()
+        # Rubber-band past the first/last page
+        if (dx > 0 and drag["left"] is None) or (dx < 0 and drag["right"] is None):
+            dx = dx / 4
+        _drag_to(dx)
+
     def on_press(evt):
+        woke = power.state != "full"
+        power.activity()
+        if woke:
+            gesture["active"] = False   # the waking touch doesn't also press what's under it
+            return
         gesture["x"] = evt.x
         gesture["y"] = evt.y
         gesture["t"] = time.time()
@@ -423,6 +687,18 @@ def run_touch_ui(fullscreen: bool = True):
     def on_release(evt):
         if not gesture["active"]:
             return
+        if drag["on"]:
+            gesture["active"] = False
+            if drag["anim"] is not None:
+                return
+            _drag_apply()
+            dx = drag["offset"]
+            fling = time.time() - gesture["t"] <= SWIPE_MAX_TIME and abs(dx) >= SWIPE_MIN_DIST // 2
+            if (abs(dx) >= WINDOW_W // 3 or fling or abs(dx) >= SWIPE_MIN_DIST) and drag["right" if dx < 0 else "left"]:
+                _drag_settle(-WINDOW_W if dx < 0 else WINDOW_W, drag["right" if dx < 0 else "left"])
+            else:
+                _drag_settle(0, None)
+            return
         dx = evt.x - gesture["x"]
         dy = evt.y - gesture["y"]
         dt = time.time() - gesture["t"]
@@ -447,6 +723,8 @@ def run_touch_ui(fullscreen: bool = True):
                 else:
                     if mode["view"] == "alarm":
                         mode["view"] = "clock"
+            # Show the new page now (usually already prefetched) instead of on the next tick
+            render()
         else:
             if mode["view"] == "alarm":
                 x, y = evt.x, evt.y
@@ -524,16 +802,35 @@ def run_touch_ui(fullscreen: bool = True):
                 return
 
     def close_window(event=None):
+        splash_job(force=True)
         root.attributes("-fullscreen", False)
         root.destroy()
 
-    label.bind("<Button-1>", on_press)
-    label.bind("<ButtonRelease-1>", on_release)
+    canvas.bind("<Button-1>", on_press)
+    canvas.bind("<B1-Motion>", on_motion)
+    canvas.bind("<ButtonRelease-1>", on_release)
     root.bind("<Escape>", close_window)
 
+    def _first_frame():
+        root.update_idletasks()
+        ms = (time.monotonic() - _T_START) * 1000
+        print(f"First frame after {ms:.0f} ms")
+        if ms > FIRST_FRAME_BUDGET_MS:
+            print(f"WARNING: first frame over budget ({ms:.0f} > {FIRST_FRAME_BUDGET_MS:.0f} ms)")
+        if EXIT_AFTER_FIRST_FRAME:
+            root.destroy()
+            return
+        import threading
+        threading.Thread(target=_start_speech, name="speech-startup", daemon=True).start()
+
     render()
-    tick()
-    root.mainloop()
+    root.after_idle(_first_frame)
+    sched.start()
+    try:
+        root.mainloop()
+    finally:
+        if voice_inbox is not None:
+            voice_inbox.close()
     return 0
 
 